@@ -2,18 +2,59 @@
 Setup script for Unified Media Converter
 """
 
-from setuptools import setup, find_packages
+import compileall
+import os
+import sys
+from setuptools import setup
+from setuptools.command.build_py import build_py
 from pathlib import Path
 
 # The directory containing this file
 HERE = Path(__file__).parent
 
-# The text of the README file
-README = (HERE / "README.md").read_text(encoding='utf-8')
+# The text of the README file, only needed when building a distribution
+# (metadata-only and develop/egg_info runs skip the read)
+if any(arg in ("sdist", "upload") or arg.startswith("bdist") for arg in sys.argv[1:]):
+    README = (HERE / "README.md").read_text(encoding='utf-8')
+else:
+    README = ""
+
+# Optional ahead-of-time compiled build of the converter module (COMPILE=1,
+# requires Cython). Wheels built this way load the module as a native
+# extension; source installs and the sdist stay pure Python.
+EXT_MODULES = []
+if os.environ.get("COMPILE"):
+    from Cython.Build import cythonize
+    from setuptools import Extension
+
+    EXT_MODULES = cythonize(
+        [
+            Extension(
+                "unified_media_converter.unified_media_converter",
+                ["src/unified_media_converter.py"],
+            )
+        ],
+        compiler_directives={"language_level": "3", "binding": True},
+        quiet=True,
+    )
+
+
+class BuildPyWithBytecode(build_py):
+    """build_py that also ships __pycache__ bytecode for the built modules.
+
+    Lets the first start on read-only installs (containers, frozen images)
+    skip compiling the sources. py_compile switches to hash-checked pycs when
+    SOURCE_DATE_EPOCH is set, keeping reproducible builds reproducible.
+    """
+
+    def run(self):
+        super().run()
+        if not self.dry_run:
+            compileall.compile_dir(self.build_lib, quiet=1)
+
 
 setup(
     name="unified-media-converter",
-    version="1.0.0",
     description="Professional audio and video converter with advanced parametric EQ capabilities",
     long_description=README,
     long_description_content_type="text/markdown",
@@ -39,15 +80,31 @@ setup(
         "Topic :: Multimedia :: Video :: Conversion",
         "Topic :: Scientific/Engineering :: Visualization",
     ],
-    packages=find_packages(where="src"),
+    # The sources live directly in src/ and are installed as the
+    # unified_media_converter package (see the console script below).
+    packages=["unified_media_converter"],
+    package_dir={"unified_media_converter": "src"},
+    ext_modules=EXT_MODULES,
+    cmdclass={"build_py": BuildPyWithBytecode},
+    exclude_package_data={"unified_media_converter": ["*.c"]},
     include_package_data=True,
     install_requires=[
-        "ffmpeg-python>=0.2.0",
         "numpy>=1.21.0",
-        "matplotlib>=3.4.0",
-        "simpleaudio>=1.0.0",
-        "tkinterdnd2>=0.3.0",
     ],
+    extras_require={
+        "gui": ["tkinterdnd2>=0.3.0"],
+        "advanced-plots": ["matplotlib>=3.4.0"],
+        "preview": ["simpleaudio>=1.0.0"],
+        "fast-dsp": ["scipy>=1.4.0"],
+        "jit": ["numba>=0.50.0"],
+        "all": [
+            "tkinterdnd2>=0.3.0",
+            "matplotlib>=3.4.0",
+            "simpleaudio>=1.0.0",
+            "scipy>=1.4.0",
+            "numba>=0.50.0",
+        ],
+    },
     entry_points={
         "console_scripts": [
             "unified-media-converter=unified_media_converter.__main__:main",
@@ -2,12 +2,47 @@
 Unified Media Converter Package
 """
 
-__version__ = "1.0.0"
-__author__ = "Unified Media Converter Team"
-__email__ = "support@unified-media-converter.org"
-__license__ = "MIT"
-__copyright__ = "Copyright 2025 Unified Media Converter Project"
+import importlib.machinery
+import importlib.util
+import sys
 
-from .unified_media_converter import main
+from ._version import __version__
 
 __all__ = ["main"]
+
+
+def _register_lazy_submodule(name):
+    # Put a LazyLoader-backed module in sys.modules: its body (Tk, numpy, ...)
+    # only executes on first attribute access. An explicit
+    # "import pkg.unified_media_converter" or "from pkg import
+    # unified_media_converter" touches the module and so still runs it.
+    # Compiled (extension) builds keep the regular import path.
+    fullname = f"{__name__}.{name}"
+    if fullname in sys.modules:
+        return
+    spec = importlib.util.find_spec(fullname)
+    if spec is None or not isinstance(spec.loader, importlib.machinery.SourceFileLoader):
+        return
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[fullname] = module
+    loader.exec_module(module)
+
+
+_register_lazy_submodule("unified_media_converter")
+
+
+def __getattr__(name):
+    # Resolved on first access and cached in the module namespace, so that
+    # importing the package does not load the GUI module
+    if name == "main":
+        from .unified_media_converter import main as value
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + ["main"])
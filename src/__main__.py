@@ -5,4 +5,4 @@ Main entry point for Unified Media Converter
 from .unified_media_converter import main
 
 if __name__ == "__main__":
-    main()
+    raise SystemExit(main())
@@ -0,0 +1,3 @@
+"""Version of the Unified Media Converter package (single source of truth)."""
+
+__version__ = "1.0.0"
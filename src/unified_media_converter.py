@@ -21,7 +21,9 @@ Features combined and expanded from previous versions:
 Requirements:
  - Python 3.8+
  - ffmpeg and ffprobe in PATH
- - Optional but recommended: pip install numpy matplotlib simpleaudio tkinterdnd2
+ - numpy (pip install numpy)
+ - Optional extras: pip install unified-media-converter[gui,advanced-plots,preview,fast-dsp,jit] (or [all])
+   (preview playback falls back to sounddevice or ffplay without simpleaudio)
 
 Save as unified_media_converter.py and run:
     python unified_media_converter.py
@@ -41,9 +43,14 @@ import queue
 import time
 import traceback
 import wave
+import struct
+import functools
+import contextlib
+import importlib
+import importlib.util
 from pathlib import Path
-from dataclasses import dataclass, asdict
-from typing import List, Optional, Dict, Any, Tuple
+from dataclasses import dataclass, asdict, astuple
+from typing import List, Optional, Dict, Any, Tuple, Iterable, Iterator
 
 # GUI
 try:
@@ -52,47 +59,94 @@ try:
 except Exception as e:
     raise RuntimeError('Tkinter required')
 
-# Optional drag-and-drop
+# Optional drag-and-drop (extra: gui)
 DND_AVAILABLE = False
 try:
     from tkinterdnd2 import DND_FILES, TkinterDnD
     DND_AVAILABLE = True
-except Exception:
+except ImportError:
     DND_AVAILABLE = False
 
-# Optional libs
+# DSP (core dependency, still guarded so the GUI starts without it)
 NP_AVAILABLE = True
-MATPLOTLIB_AVAILABLE = True
-FigureCanvasTkAgg = None
-Figure = None
 try:
     import numpy as np
-    import matplotlib
-    matplotlib.use('TkAgg')
-    from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-    from matplotlib.figure import Figure
-except Exception:
+except ImportError:
     NP_AVAILABLE = False
-    MATPLOTLIB_AVAILABLE = False
-    FigureCanvasTkAgg = None
-    Figure = None
 
-SIMPLEAUDIO_AVAILABLE = True
-try:
-    import simpleaudio as sa
-except Exception:
-    SIMPLEAUDIO_AVAILABLE = False
+# Optional PNG export of the EQ curve (extra: advanced-plots), imported by
+# _load_matplotlib() on first export; the visualiser itself draws on a Tk Canvas
+MATPLOTLIB_AVAILABLE = importlib.util.find_spec('matplotlib') is not None
+Figure = None
+
+# Optional faster FIR convolution (extra: fast-dsp); scipy.fft is imported
+# on first use by the FFT helpers
+SCIPY_AVAILABLE = importlib.util.find_spec('scipy') is not None
+
+# Optional JIT-compiled biquad responses (extra: jit); numba is imported and
+# the kernel compiled on the first response calculation
+NUMBA_AVAILABLE = importlib.util.find_spec('numba') is not None
 
 # Constants
 APP_TITLE = 'Unified Media Converter v7'
 PRESETS_FILE = Path.home() / '.umc_presets.json'
 PREVIEW_DURATION = 6
 LOG_MAX_LINES = 3000
+# ffmpeg is itself multi-threaded: each job is capped at DEFAULT_THREADS_PER_JOB
+# threads and the cores are split between jobs rather than oversubscribed
+DEFAULT_THREADS_PER_JOB = 2
+DEFAULT_PARALLEL_JOBS = max(1, (os.cpu_count() or 2) // DEFAULT_THREADS_PER_JOB)
+
+# Visualiser plot range
+VIS_FS = 44100.0
+VIS_FREQ_RANGE = (20.0, 20000.0)
+VIS_DB_LIMIT = 36.0
+
+# Prepended to ffmpeg commands run through Worker._run_cmd_with_progress
+FFMPEG_PROGRESS_ARGS = ['-progress', 'pipe:1', '-nostats']
 
 # Media format constants
 VIDEO_FORMATS = ['mp4', 'avi', 'mkv', 'mov', 'wmv', 'flv', 'webm']
 AUDIO_FORMATS = ['mp3', 'aac', 'flac', 'wav', 'm4a', 'ogg', 'wma']
 ALL_FORMATS = VIDEO_FORMATS + AUDIO_FORMATS
+MEDIA_EXTENSIONS = frozenset('.' + e for e in ALL_FORMATS)
+# Export task action by (input type, output type); anything else is 'apply_eq'
+EXPORT_ACTIONS = {
+    ('video', 'video'): 'convert_video',
+    ('video', 'audio'): 'extract_audio',
+    ('audio', 'audio'): 'convert_audio',
+}
+# Task option holding the export dialog's audio bitrate, by output format
+BITRATE_OPTION_KEYS = {'mp3': 'mp3_bitrate', 'aac': 'aac_bitrate', 'ogg': 'ogg_bitrate'}
+# Band fields edited from the EQ rows, with the parser for their widget values
+BAND_FIELD_PARSERS = {'type': str, 'f': float, 'width': float, 'g': float}
+
+# Hardware encoders tried (in order) for a software codec when the task opts
+# in to hardware encoding; all of them accept frames from system memory
+HW_VIDEO_ENCODERS = {
+    'libx264': ('h264_nvenc', 'h264_qsv', 'h264_videotoolbox'),
+    'libx265': ('hevc_nvenc', 'hevc_qsv', 'hevc_videotoolbox'),
+}
+HW_ENCODER_ARGS = {
+    'h264_nvenc': ['-preset', 'p4', '-tune', 'hq'],
+    'hevc_nvenc': ['-preset', 'p4', '-tune', 'hq'],
+    'h264_qsv': ['-preset', 'medium'],
+    'hevc_qsv': ['-preset', 'medium'],
+}
+X264_PRESETS = ['ultrafast', 'superfast', 'veryfast', 'faster', 'fast', 'medium', 'slow', 'slower', 'veryslow']
+# Codecs offered explicitly in the export dialog; unlike the fallbacks above
+# these keep decoded frames on the device (input options before -i, plus an
+# upload filter for VAAPI)
+VIDEO_CODECS = ['libx264', 'libx265', 'h264_nvenc', 'hevc_nvenc', 'h264_qsv', 'hevc_qsv',
+                'h264_vaapi', 'hevc_vaapi', 'copy']
+HW_DEVICE_INPUT_ARGS = {
+    'nvenc': ['-hwaccel', 'cuda', '-hwaccel_output_format', 'cuda'],
+    'qsv': ['-init_hw_device', 'qsv=hw', '-filter_hw_device', 'hw', '-hwaccel', 'qsv', '-hwaccel_output_format', 'qsv'],
+    'vaapi': ['-vaapi_device', '/dev/dri/renderD128'],
+}
+HW_DEVICE_OUTPUT_ARGS = {
+    'vaapi': ['-vf', 'format=nv12|vaapi,hwupload'],
+}
 
 # ---------------- Data classes ----------------
 @dataclass
@@ -120,20 +174,133 @@ class Task:
 # ---------------- Utilities ----------------
 import shlex
 
+def _load_matplotlib() -> bool:
+    """Import matplotlib's Figure on first use; returns availability."""
+    global MATPLOTLIB_AVAILABLE, Figure
+    if Figure is not None:
+        return True
+    if not MATPLOTLIB_AVAILABLE:
+        return False
+    try:
+        from matplotlib.figure import Figure as _figure_cls
+    except ImportError:
+        MATPLOTLIB_AVAILABLE = False
+        return False
+    Figure = _figure_cls
+    return True
+
 def which_exe(name: str) -> Optional[str]:
     return shutil.which(name)
 
-def ffprobe_duration(path: str) -> float:
-    ffprobe = which_exe('ffprobe')
-    if ffprobe is None:
-        return 0.0
-    cmd = [ffprobe, '-v', 'error', '-show_entries', 'format=duration', '-of', 'default=noprint_wrappers=1:nokey=1', path]
+# Resolved once at import rather than walking PATH for every command
+FFMPEG = which_exe('ffmpeg') or 'ffmpeg'
+FFPROBE = which_exe('ffprobe')
+
+@functools.lru_cache(maxsize=None)
+def _get_audio_backend() -> Optional[Tuple[str, Any]]:
+    """Pick the preview playback backend on first use.
+
+    Tries simpleaudio (extra: preview), then sounddevice, then an ffplay
+    subprocess. Returns (name, module or ffplay path), or None.
+    """
+    for mod in ('simpleaudio', 'sounddevice'):
+        if mod == 'sounddevice' and not NP_AVAILABLE:
+            continue
+        try:
+            return mod, importlib.import_module(mod)
+        except Exception:
+            # sounddevice raises OSError when PortAudio is missing
+            continue
+    ffplay = which_exe('ffplay')
+    if ffplay:
+        return 'ffplay', ffplay
+    return None
+
+@functools.lru_cache(maxsize=4096)
+def _probe_cached(path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    if FFPROBE is None:
+        return {}
+    cmd = [FFPROBE, '-v', 'error', '-of', 'json', '-show_format', '-show_streams', path]
     try:
         out = subprocess.check_output(cmd, stderr=subprocess.DEVNULL)
-        return float(out.decode().strip())
+        return json.loads(out.decode('utf-8', 'replace'))
     except Exception:
+        return {}
+
+def probe_media(path: str) -> Dict[str, Any]:
+    """ffprobe format and stream info as a dict, probed once per file version.
+
+    The result is cached on (path, mtime, size) and shared; do not modify it.
+    """
+    try:
+        st = os.stat(path)
+    except OSError:
+        return {}
+    return _probe_cached(os.path.abspath(path), st.st_mtime_ns, st.st_size)
+
+def ffprobe_duration(path: str) -> float:
+    try:
+        return float(probe_media(path).get('format', {}).get('duration', 0.0))
+    except (TypeError, ValueError):
         return 0.0
 
+def iter_pipe_lines(fd: int, chunk_size: int = 65536) -> Iterator[bytes]:
+    """Yield non-empty CR- or LF-terminated lines from a raw pipe, undecoded."""
+    pending = b''
+    while True:
+        chunk = os.read(fd, chunk_size)
+        if not chunk:
+            break
+        lines = (pending + chunk).replace(b'\r', b'\n').split(b'\n')
+        pending = lines.pop()
+        for line in lines:
+            line = line.strip()
+            if line:
+                yield line
+    pending = pending.strip()
+    if pending:
+        yield pending
+
+@functools.lru_cache(maxsize=None)
+def detect_hw_encoders() -> frozenset:
+    """Hardware video encoders compiled into the ffmpeg build (probed once).
+
+    A listed encoder still needs the matching GPU and driver at run time.
+    """
+    try:
+        out = subprocess.check_output([FFMPEG, '-hide_banner', '-encoders'], stderr=subprocess.DEVNULL, timeout=15)
+    except Exception:
+        return frozenset()
+    known = {name for names in HW_VIDEO_ENCODERS.values() for name in names}
+    known.update(c for c in VIDEO_CODECS if c.rpartition('_')[2] in HW_DEVICE_INPUT_ARGS)
+    found = set()
+    for line in out.decode('utf-8', 'replace').splitlines():
+        parts = line.split()
+        if len(parts) >= 2 and parts[1] in known:
+            found.add(parts[1])
+    return frozenset(found)
+
+@functools.lru_cache(maxsize=None)
+def hw_encoder_works(name: str) -> bool:
+    """Whether a one-frame test encode with name succeeds (probed once per encoder).
+
+    Stock ffmpeg builds list nvenc/qsv even without the GPU; opening the
+    encoder is what fails.
+    """
+    cmd = [FFMPEG, '-hide_banner', '-v', 'error', '-f', 'lavfi', '-i', 'nullsrc=s=256x256',
+           '-frames:v', '1', '-c:v', name, '-f', 'null', '-']
+    try:
+        return subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=15).returncode == 0
+    except Exception:
+        return False
+
+def pick_hw_encoder(video_codec: str) -> Optional[str]:
+    available = detect_hw_encoders()
+    for name in HW_VIDEO_ENCODERS.get(video_codec, ()):
+        if name in available and hw_encoder_works(name):
+            return name
+    return None
+
 def get_file_type(path: str) -> str:
     """Determine if file is audio or video based on extension"""
     ext = Path(path).suffix.lower().lstrip('.')
@@ -143,34 +310,175 @@ def get_file_type(path: str) -> str:
         return 'audio'
     return 'unknown'
 
+def iter_media_files(folder: str) -> Iterator[str]:
+    """Yield the paths of supported media files below folder (recursive)."""
+    stack = [folder]
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                        continue
+                except OSError:
+                    continue
+                name = entry.name
+                dot = name.rfind('.')
+                if dot > 0 and name[dot:].lower() in MEDIA_EXTENSIONS:
+                    yield entry.path
+
 def get_media_info(path: str) -> Dict[str, Any]:
     """Get detailed media information using ffprobe"""
-    ffprobe = which_exe('ffprobe')
-    if ffprobe is None:
-        return {}
-    
-    # Get format info
-    cmd = [ffprobe, '-v', 'error', '-show_entries', 
-           'format=duration,size,bit_rate,format_name', 
-           '-of', 'default=noprint_wrappers=1', path]
-    
-    try:
-        out = subprocess.check_output(cmd, stderr=subprocess.DEVNULL)
-        info = {}
-        for line in out.decode().strip().split('\n'):
-            if '=' in line:
-                k, v = line.split('=', 1)
-                info[k] = v
-        return info
-    except Exception:
-        return {}
+    fmt = probe_media(path).get('format', {})
+    return {k: str(fmt[k]) for k in ('duration', 'size', 'bit_rate', 'format_name') if k in fmt}
+
+WAV_HEADER_SIZE = 44
+
+def read_wav_layout(path: str) -> Tuple[int, int, int, int, int]:
+    """Return (channels, sample_rate, sample_width, data_offset, data_bytes) of a PCM WAV.
+
+    Walks the RIFF chunks, so LIST/fact chunks written by ffmpeg are skipped.
+    """
+    with open(path, 'rb') as f:
+        riff, _, wave_id = struct.unpack('<4sI4s', f.read(12))
+        if riff != b'RIFF' or wave_id != b'WAVE':
+            raise RuntimeError(f'Not a WAV file: {path}')
+        fmt = None
+        while True:
+            hdr = f.read(8)
+            if len(hdr) < 8:
+                raise RuntimeError(f'No data chunk in {path}')
+            cid, size = struct.unpack('<4sI', hdr)
+            if cid == b'fmt ':
+                fmt = struct.unpack('<HHIIHH', f.read(16))
+                f.seek(size - 16 + (size & 1), os.SEEK_CUR)
+            elif cid == b'data':
+                if fmt is None:
+                    raise RuntimeError(f'Missing fmt chunk in {path}')
+                offset = f.tell()
+                # streamed ffmpeg output may leave the size field unset
+                available = os.fstat(f.fileno()).st_size - offset
+                return fmt[1], fmt[2], fmt[5] // 8, offset, min(size, available)
+            else:
+                f.seek(size + (size & 1), os.SEEK_CUR)
+
+def wav_header(nch: int, sr: int, data_bytes: int, sampwidth: int = 2) -> bytes:
+    """Canonical 44-byte PCM WAV header."""
+    block_align = nch * sampwidth
+    return struct.pack('<4sI4s4sIHHIIHH4sI', b'RIFF', 36 + data_bytes, b'WAVE', b'fmt ', 16, 1,
+                       nch, sr, sr * block_align, block_align, sampwidth * 8, b'data', data_bytes)
+
+class WavWriter:
+    """Streaming 16-bit PCM WAV writer for output of unknown length.
+
+    A placeholder header is written up front, PCM goes straight to the file
+    and the RIFF/data sizes are patched on close. expected_frames, when
+    known, is used to preallocate the file.
+    """
+    def __init__(self, path: str, nch: int, sr: int, expected_frames: int = 0):
+        self._f = open(path, 'wb')
+        self._f.write(wav_header(nch, sr, 0))
+        self.data_bytes = 0
+        if expected_frames > 0 and hasattr(os, 'posix_fallocate'):
+            try:
+                os.posix_fallocate(self._f.fileno(), 0, WAV_HEADER_SIZE + expected_frames * nch * 2)
+            except OSError:
+                pass
+
+    def write(self, data: bytes) -> int:
+        n = self._f.write(data)
+        self.data_bytes += n
+        return n
+
+    def close(self):
+        if self._f.closed:
+            return
+        try:
+            self._f.truncate(WAV_HEADER_SIZE + self.data_bytes)
+            self._f.seek(4)
+            self._f.write(struct.pack('<I', 36 + self.data_bytes))
+            self._f.seek(40)
+            self._f.write(struct.pack('<I', self.data_bytes))
+        finally:
+            self._f.close()
+
+    def __enter__(self) -> 'WavWriter':
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
 
 # ---------------- DSP & FIR helpers ----------------
 if NP_AVAILABLE:
-    import cmath
     import numpy as np
 
-    def peaking_eq_response(band: Band, freqs: np.ndarray, fs: float) -> np.ndarray:
+    BiquadCoeffs = Tuple[Tuple[float, float, float], Tuple[float, float, float]]
+    UNITY_COEFFS: BiquadCoeffs = ((1.0, 0.0, 0.0), (1.0, 0.0, 0.0))
+
+    def _z_terms(freqs: np.ndarray, fs: float) -> Tuple[np.ndarray, np.ndarray]:
+        z1 = np.exp(-1j * (2 * math.pi * freqs / fs))
+        return z1, z1 * z1
+
+    @functools.lru_cache(maxsize=None)
+    def _biquad_product_kernel():
+        try:
+            import numba
+        except ImportError:
+            return None
+
+        def kernel(B, A, ws, out):
+            # one pass over the frequencies: z^-1 = c - js, z^-2 = c2 - js2
+            for i in range(ws.shape[0]):
+                c = math.cos(ws[i]); s = math.sin(ws[i])
+                c2 = c * c - s * s; s2 = 2.0 * c * s
+                acc = 1.0 + 0.0j
+                for k in range(B.shape[0]):
+                    num = complex(B[k, 0] + B[k, 1] * c + B[k, 2] * c2, -(B[k, 1] * s + B[k, 2] * s2))
+                    den = complex(A[k, 0] + A[k, 1] * c + A[k, 2] * c2, -(A[k, 1] * s + A[k, 2] * s2))
+                    acc *= num / den
+                out[i] = acc
+
+        # serial on purpose: workers and the preview thread call this at the
+        # same time, which numba's workqueue threading layer aborts on.
+        # Compiled (Cython) builds cannot be jitted, and a typing error only
+        # shows on the first call, so compile eagerly and fall back to numpy.
+        try:
+            kernel = numba.njit(fastmath=True, cache=True)(kernel)
+            kernel(np.ones((1, 3)), np.ones((1, 3)), np.zeros(1), np.empty(1, dtype=complex))
+        except Exception:
+            return None
+        return kernel
+
+    def _biquad_responses(coeffs: np.ndarray, freqs: np.ndarray, fs: float) -> np.ndarray:
+        """(n_bands, len(freqs)) responses of an (n_bands, 2, 3) coefficient array."""
+        # every biquad is evaluated in one broadcast against shared z terms
+        B = coeffs[:, 0, :, None]; A = coeffs[:, 1, :, None]
+        z1, z2 = _z_terms(freqs, fs)
+        num = B[:, 0] + B[:, 1] * z1 + B[:, 2] * z2
+        den = A[:, 0] + A[:, 1] * z1 + A[:, 2] * z2
+        return np.divide(num, den, out=num)
+
+    def _biquad_product(coeffs: np.ndarray, freqs: np.ndarray, fs: float) -> np.ndarray:
+        """Product of the biquads in an (n_bands, 2, 3) coefficient array at freqs."""
+        kernel = _biquad_product_kernel() if NUMBA_AVAILABLE else None
+        if kernel is not None:
+            out = np.empty(len(freqs), dtype=complex)
+            ws = 2 * math.pi * np.asarray(freqs, dtype=float) / fs
+            kernel(np.ascontiguousarray(coeffs[:, 0]), np.ascontiguousarray(coeffs[:, 1]), ws, out)
+            return out
+        return np.prod(_biquad_responses(coeffs, freqs, fs), axis=0)
+
+    def _biquad_response(coeffs: BiquadCoeffs, freqs: np.ndarray, fs: float, z1: Optional[np.ndarray] = None, z2: Optional[np.ndarray] = None) -> np.ndarray:
+        if z1 is None or z2 is None:
+            return _biquad_product(np.array([coeffs], dtype=float), freqs, fs)
+        (b0, b1, b2), (a0, a1, a2) = coeffs
+        return (b0 + b1 * z1 + b2 * z2) / (a0 + a1 * z1 + a2 * z2)
+
+    def peaking_eq_coeffs(band: Band, fs: float) -> BiquadCoeffs:
         f0 = float(max(1.0, min(band.f, fs/2 - 1)))
         G = 10**(band.g / 40.0)
         if band.width_type == 'q':
@@ -190,20 +498,14 @@ if NP_AVAILABLE:
         a0 = 1 + alpha / G
         a1 = -2 * cosw0
         a2 = 1 - alpha / G
-        ws = 2 * math.pi * freqs / fs
-        z1 = np.exp(-1j * ws)
-        z2 = np.exp(-2j * ws)
-        num = b0 + b1 * z1 + b2 * z2
-        den = a0 + a1 * z1 + a2 * z2
-        H = num / den
         if band.invert:
-            H = -H
-        return H
+            b0, b1, b2 = -b0, -b1, -b2
+        return (b0, b1, b2), (a0, a1, a2)
 
-    def lowpass_response(fc: float, freqs: np.ndarray, fs: float) -> np.ndarray:
+    def lowpass_coeffs(fc: float, fs: float) -> BiquadCoeffs:
         Q = 1 / math.sqrt(2)
         w0 = 2 * math.pi * fc / fs
-        cosw0 = np.cos(w0); sinw0 = np.sin(w0)
+        cosw0 = math.cos(w0); sinw0 = math.sin(w0)
         alpha = sinw0 / (2 * Q)
         b0 = (1 - cosw0) / 2
         b1 = 1 - cosw0
@@ -211,16 +513,12 @@ if NP_AVAILABLE:
         a0 = 1 + alpha
         a1 = -2 * cosw0
         a2 = 1 - alpha
-        ws = 2 * math.pi * freqs / fs
-        z1 = np.exp(-1j * ws)
-        z2 = np.exp(-2j * ws)
-        H = (b0 + b1 * z1 + b2 * z2) / (a0 + a1 * z1 + a2 * z2)
-        return H
+        return (b0, b1, b2), (a0, a1, a2)
 
-    def highpass_response(fc: float, freqs: np.ndarray, fs: float) -> np.ndarray:
+    def highpass_coeffs(fc: float, fs: float) -> BiquadCoeffs:
         Q = 1 / math.sqrt(2)
         w0 = 2 * math.pi * fc / fs
-        cosw0 = np.cos(w0); sinw0 = np.sin(w0)
+        cosw0 = math.cos(w0); sinw0 = math.sin(w0)
         alpha = sinw0 / (2 * Q)
         b0 = (1 + cosw0) / 2
         b1 = -(1 + cosw0)
@@ -228,25 +526,118 @@ if NP_AVAILABLE:
         a0 = 1 + alpha
         a1 = -2 * cosw0
         a2 = 1 - alpha
-        ws = 2 * math.pi * freqs / fs
-        z1 = np.exp(-1j * ws)
-        z2 = np.exp(-2j * ws)
-        H = (b0 + b1 * z1 + b2 * z2) / (a0 + a1 * z1 + a2 * z2)
-        return H
+        return (b0, b1, b2), (a0, a1, a2)
+
+    def band_coeffs(band: Band, fs: float) -> BiquadCoeffs:
+        if band.type == 'parametric':
+            return peaking_eq_coeffs(band, fs)
+        if band.type == 'lowpass':
+            return lowpass_coeffs(band.f, fs)
+        if band.type == 'highpass':
+            return highpass_coeffs(band.f, fs)
+        return UNITY_COEFFS
+
+    def peaking_eq_response(band: Band, freqs: np.ndarray, fs: float, z1: Optional[np.ndarray] = None, z2: Optional[np.ndarray] = None) -> np.ndarray:
+        return _biquad_response(peaking_eq_coeffs(band, fs), freqs, fs, z1, z2)
+
+    def lowpass_response(fc: float, freqs: np.ndarray, fs: float, z1: Optional[np.ndarray] = None, z2: Optional[np.ndarray] = None) -> np.ndarray:
+        return _biquad_response(lowpass_coeffs(fc, fs), freqs, fs, z1, z2)
+
+    def highpass_response(fc: float, freqs: np.ndarray, fs: float, z1: Optional[np.ndarray] = None, z2: Optional[np.ndarray] = None) -> np.ndarray:
+        return _biquad_response(highpass_coeffs(fc, fs), freqs, fs, z1, z2)
+
+    BAND_TYPE_CODES = {'parametric': 0, 'lowpass': 1, 'highpass': 2}
+
+    @dataclass(eq=False)
+    class BandArray:
+        """Structure-of-arrays copy of a band list for vectorized coefficient design."""
+        type_code: np.ndarray  # int8, -1 for unknown types (unity response)
+        f: np.ndarray
+        width: np.ndarray
+        g: np.ndarray
+        octave: np.ndarray     # width is in octaves rather than Q
+        invert: np.ndarray
+
+        @classmethod
+        def from_bands(cls, bands: List[Band]) -> 'BandArray':
+            return cls(
+                type_code=np.array([BAND_TYPE_CODES.get(b.type, -1) for b in bands], dtype=np.int8),
+                f=np.array([b.f for b in bands], dtype=float),
+                width=np.array([b.width for b in bands], dtype=float),
+                g=np.array([b.g for b in bands], dtype=float),
+                octave=np.array([b.width_type != 'q' for b in bands], dtype=bool),
+                invert=np.array([b.invert for b in bands], dtype=bool),
+            )
 
-    def compute_total_response(bands: List[Band], freqs: np.ndarray, fs: float) -> np.ndarray:
-        H_total = np.ones_like(freqs, dtype=complex)
-        for b in bands:
-            if b.type == 'parametric':
-                H = peaking_eq_response(b, freqs, fs)
-            elif b.type == 'lowpass':
-                H = lowpass_response(b.f, freqs, fs)
-            elif b.type == 'highpass':
-                H = highpass_response(b.f, freqs, fs)
-            else:
-                H = np.ones_like(freqs, dtype=complex)
-            H_total *= H
-        return H_total
+        def __len__(self) -> int:
+            return len(self.type_code)
+
+        def coeffs(self, fs: float) -> np.ndarray:
+            """(n_bands, 2, 3) biquad [B, A] coefficients, same formulas as band_coeffs."""
+            n = len(self)
+            out = np.zeros((n, 2, 3))
+            out[:, :, 0] = 1.0
+            # peaking
+            pk = self.type_code == 0
+            f0 = np.clip(self.f[pk], 1.0, fs / 2 - 1)
+            G = 10 ** (self.g[pk] / 40.0)
+            half = 2 ** (np.maximum(0.001, self.width[pk]) / 2)
+            # f2 - f1 is never tiny because f0 >= 1 and bw >= 0.001
+            Q = np.where(self.octave[pk], f0 / (f0 * half - f0 / half), np.maximum(0.01, self.width[pk]))
+            w0 = 2 * math.pi * f0 / fs
+            cosw0 = np.cos(w0)
+            alpha = np.sin(w0) / (2 * Q)
+            sign = np.where(self.invert[pk], -1.0, 1.0)
+            out[pk, 0] = sign[:, None] * np.stack([1 + alpha * G, -2 * cosw0, 1 - alpha * G], axis=1)
+            out[pk, 1] = np.stack([1 + alpha / G, -2 * cosw0, 1 - alpha / G], axis=1)
+            # lowpass / highpass (Butterworth Q)
+            for code, sgn in ((1, -1.0), (2, 1.0)):
+                sel = self.type_code == code
+                w0 = 2 * math.pi * self.f[sel] / fs
+                cosw0 = np.cos(w0)
+                alpha = np.sin(w0) / (2 / math.sqrt(2))
+                edge = (1 + sgn * cosw0) / 2
+                out[sel, 0] = np.stack([edge, -sgn * 2 * edge, edge], axis=1)
+                out[sel, 1] = np.stack([1 + alpha, -2 * cosw0, 1 - alpha], axis=1)
+            return out
+
+    def compute_total_response(bands, freqs: np.ndarray, fs: float) -> np.ndarray:
+        """Total response of a band list or BandArray."""
+        arr = bands if isinstance(bands, BandArray) else BandArray.from_bands(bands)
+        if not len(arr):
+            return np.ones_like(freqs, dtype=complex)
+        return _biquad_product(arr.coeffs(fs), freqs, fs)
+
+    def compute_per_band_responses(bands, freqs: np.ndarray, fs: float) -> np.ndarray:
+        """(n_bands, len(freqs)) complex response of each band; their product is the total."""
+        arr = bands if isinstance(bands, BandArray) else BandArray.from_bands(bands)
+        if not len(arr):
+            return np.ones((0, len(freqs)), dtype=complex)
+        return _biquad_responses(arr.coeffs(fs), freqs, fs)
+
+    @functools.lru_cache(maxsize=None)
+    def _fft_backend() -> Tuple[Any, Dict[str, Any]]:
+        # scipy.fft (pocketfft) spreads a transform over all cores; imported on
+        # first use because it is slow to load
+        if SCIPY_AVAILABLE:
+            import scipy.fft
+            return scipy.fft, {'workers': -1}
+        return np.fft, {}
+
+    def _rfft(x, n=None, axis=-1):
+        mod, kw = _fft_backend()
+        return mod.rfft(x, n=n, axis=axis, **kw)
+
+    def _irfft(x, n=None, axis=-1, overwrite_x=False):
+        # overwrite_x lets pocketfft use x as scratch; np.fft has no such option
+        mod, kw = _fft_backend()
+        if overwrite_x and mod is not np.fft:
+            kw = dict(kw, overwrite_x=True)
+        return mod.irfft(x, n=n, axis=axis, **kw)
+
+    def _ifft(x, n=None, axis=-1):
+        mod, kw = _fft_backend()
+        return mod.ifft(x, n=n, axis=axis, **kw)
 
     def design_linear_phase_fir(bands: List[Band], fs: int, n_taps: int = 2048) -> np.ndarray:
         if n_taps % 2 != 0:
@@ -255,103 +646,261 @@ if NP_AVAILABLE:
         freqs = np.linspace(0, fs/2, n_freq//2 + 1)
         H_pos = compute_total_response(bands, freqs, fs)
         full = np.concatenate([H_pos, np.conj(H_pos[-2:0:-1])])
-        h = np.fft.ifft(full)
+        h = _ifft(full)
         h = np.real(h)
         win = np.hanning(len(h))
         h = h * win
         s = np.sum(h)
         if abs(s) > 1e-12:
             h /= s
+        # kept in double precision for the coefficient export; the
+        # convolution paths cast to float32 themselves
         return h[:n_taps]
 
+    @functools.lru_cache(maxsize=32)
+    def _cached_fir(bands_key: Tuple[tuple, ...], fs: int, n_taps: int) -> np.ndarray:
+        h = design_linear_phase_fir([Band(*k) for k in bands_key], fs, n_taps)
+        h.setflags(write=False)
+        return h
+
+    def cached_linear_phase_fir(bands: List[Band], fs: int, n_taps: int = 2048) -> np.ndarray:
+        """design_linear_phase_fir memoized on the band settings; the result is read-only."""
+        return _cached_fir(tuple(astuple(b) for b in bands), fs, n_taps)
+
+    @functools.lru_cache(maxsize=8)
+    def _fir_spectrum(fir_bytes: bytes, N: int) -> np.ndarray:
+        H = _rfft(np.frombuffer(fir_bytes, dtype=np.float32), n=N)[:, None]
+        H.setflags(write=False)
+        return H
+
+    @functools.lru_cache(maxsize=4)
+    def equal_power_fades(n: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Read-only (n, 1) float32 cos/sin gains for an n-frame equal-power crossfade."""
+        t = np.linspace(0, math.pi / 2, n, dtype=np.float32)[:, None]
+        fades = np.cos(t), np.sin(t)
+        for g in fades:
+            g.setflags(write=False)
+        return fades
+
     def next_pow2(x: int) -> int:
         return 1 << (x - 1).bit_length()
 
-    def overlap_add_convolve_wav(in_wav: str, fir: np.ndarray, out_wav: str, block_size: int = 65536, ui_queue: Optional[queue.Queue] = None, task_id: Optional[str] = None):
-        with wave.open(in_wav, 'rb') as wf_in:
-            nch = wf_in.getnchannels(); sr = wf_in.getframerate(); sw = wf_in.getsampwidth(); nframes = wf_in.getnframes()
-            if sw != 2:
-                raise RuntimeError('Only 16-bit PCM supported for internal convolution')
-            with wave.open(out_wav, 'wb') as wf_out:
-                wf_out.setnchannels(nch); wf_out.setsampwidth(2); wf_out.setframerate(sr)
-                Lh = len(fir)
-                N = next_pow2(block_size + Lh - 1)
-                H = np.fft.rfft(fir, n=N)
-                overlap = np.zeros((Lh - 1, nch), dtype=np.float64)
-                total_frames = nframes
-                processed = 0
-                while True:
-                    frames = wf_in.readframes(block_size)
-                    if not frames:
-                        break
-                    data = np.frombuffer(frames, dtype=np.int16).astype(np.float64).reshape(-1, nch)
-                    m = data.shape[0]
-                    Y = np.zeros((N, nch), dtype=np.float64)
-                    for ch in range(nch):
-                        x = data[:, ch]
-                        X = np.fft.rfft(x, n=N)
-                        y = np.fft.irfft(X * H, n=N)
-                        Y[:, ch] = y
-                    out_block = Y[:m, :] + overlap[:m, :]
-                    out_block_clamped = np.clip(out_block, -32767, 32767).astype(np.int16)
-                    wf_out.writeframes(out_block_clamped.tobytes())
-                    overlap_new = Y[m:m + (Lh - 1), :]
-                    if overlap_new.shape[0] < (Lh - 1):
-                        pad = np.zeros(((Lh - 1) - overlap_new.shape[0], nch), dtype=np.float64)
-                        overlap = np.vstack([overlap_new, pad])
-                    else:
-                        overlap = overlap_new
-                    processed += m
-                    if ui_queue and task_id:
-                        pct = min(100.0, (processed / total_frames) * 100.0)
-                        ui_queue.put(('progress', (task_id, pct)))
-                tail = overlap
-                if tail.shape[0] > 0:
-                    tail_clamped = np.clip(tail, -32767, 32767).astype(np.int16)
-                    wf_out.writeframes(tail_clamped.tobytes())
-                if ui_queue and task_id:
-                    ui_queue.put(('progress', (task_id, 100.0)))
+    def fft_len(x: int) -> int:
+        if SCIPY_AVAILABLE:
+            from scipy.fft import next_fast_len
+            return next_fast_len(x, real=True)
+        return next_pow2(x)
+
+    def _partitioned_convolve_blocks(blocks: Iterable[np.ndarray], fir: np.ndarray, nch: int, L: int) -> Iterator[np.ndarray]:
+        # Uniformly partitioned overlap-add: the FIR is cut into K partitions
+        # of L taps so every FFT stays about 2L long however long the filter
+        # is. fdl holds the spectra of the last K input blocks, each stored
+        # twice so that fdl[newest:newest + K] is always the K most recent
+        # blocks, newest first; the sum over partitions is then one
+        # contraction of that view with the (K, F) partition spectra.
+        Lh = len(fir)
+        K = -(-Lh // L)
+        N = fft_len(2 * L)
+        parts = np.zeros(K * L, dtype=np.float32)
+        parts[:Lh] = fir
+        H = _rfft(parts.reshape(K, L), n=N, axis=1)
+        fdl = np.zeros((2 * K, N // 2 + 1, nch), dtype=H.dtype)
+        acc = np.empty((N // 2 + 1, nch), dtype=H.dtype)
+        data = np.empty((L, nch), dtype=np.float32)
+        tail = np.zeros((L - 1, nch), dtype=np.float32)
+        newest = 0
+
+        def step(block: np.ndarray) -> np.ndarray:
+            nonlocal newest
+            newest = (newest - 1) % K
+            m = block.shape[0]
+            np.copyto(data[:m], block)
+            fdl[newest] = fdl[newest + K] = _rfft(data[:m], n=N, axis=0)
+            # partition k is paired with the block that arrived k blocks ago
+            np.einsum('kfc,kf->fc', fdl[newest:newest + K], H, out=acc, optimize=True)
+            Y = _irfft(acc, n=N, axis=0, overwrite_x=True)
+            Y[:L - 1, :] += tail
+            tail[:] = Y[L:2 * L - 1, :]
+            return Y[:L, :]
+
+        n_in = emitted = 0
+        for block in blocks:
+            m = block.shape[0]
+            if m == 0:
+                continue
+            n_in += m
+            emitted += L
+            yield step(block)
+        # drain the delay line until the full len(x) + len(fir) - 1 output is out
+        remaining = n_in + Lh - 1 - emitted
+        silence = np.zeros((L, nch), dtype=np.float32)
+        while remaining > 0:
+            yield step(silence)[:min(L, remaining), :]
+            remaining -= L
+
+    def ola_convolve_blocks(blocks: Iterable[np.ndarray], fir: np.ndarray, nch: int, block_size: int) -> Iterator[np.ndarray]:
+        """Overlap-add convolution of a stream of (m <= block_size, nch) sample blocks.
+
+        Yields float32 output blocks of the same lengths, then the len(fir) - 1
+        tail. Each yielded array is only valid until the next one is requested.
+        FIRs longer than block_size use partitioned convolution; all blocks but
+        the last must then be full, and output comes in block_size pieces.
+        """
+        Lh = len(fir)
+        if Lh > block_size:
+            yield from _partitioned_convolve_blocks(blocks, fir, nch, block_size)
+            return
+        N = fft_len(block_size + Lh - 1)
+        # 16-bit input: single precision is plenty and halves the FFT working set
+        H = _fir_spectrum(np.asarray(fir, dtype=np.float32).tobytes(), N)
+        # input and overlap buffers are reused for every block; the spectrum is
+        # multiplied in place and handed to the inverse FFT as scratch
+        data = np.empty((block_size, nch), dtype=np.float32)
+        overlap = np.zeros((Lh - 1, nch), dtype=np.float32)
+        for block in blocks:
+            m = block.shape[0]
+            if m == 0:
+                continue
+            np.copyto(data[:m], block)
+            # transform all channels at once along the time axis
+            X = _rfft(data[:m], n=N, axis=0)
+            X *= H
+            Y = _irfft(X, n=N, axis=0, overwrite_x=True)
+            # N >= m + Lh - 1, so the previous tail always fits and the new one is full length
+            Y[:Lh - 1, :] += overlap
+            overlap[:] = Y[m:m + (Lh - 1), :]
+            yield Y[:m, :]
+        yield overlap
+
+    def read_pcm_blocks(stream, nch: int, block_size: int) -> Iterator[np.ndarray]:
+        """Yield (m <= block_size, nch) int16 views of raw s16le PCM read from a binary stream.
+
+        All views share one preallocated buffer that is refilled on the next
+        iteration.
+        """
+        frame_bytes = 2 * nch
+        buf = bytearray(block_size * frame_bytes)
+        view = memoryview(buf)
+        while True:
+            filled = 0
+            while filled < len(buf):
+                n = stream.readinto(view[filled:])
+                if not n:
+                    break
+                filled += n
+            m = filled // frame_bytes
+            if m:
+                yield np.frombuffer(buf, dtype=np.int16, count=m * nch).reshape(m, nch)
+            if filled < len(buf):
+                return
+
+    def map_wav_pcm(path: str) -> Tuple[np.ndarray, int]:
+        """Read-only (nframes, nch) int16 memmap of a 16-bit PCM WAV and its sample rate."""
+        nch, sr, sw, data_off, data_bytes = read_wav_layout(path)
+        if sw != 2:
+            raise RuntimeError('Only 16-bit PCM supported for internal convolution')
+        nframes = data_bytes // (2 * nch)
+        if not nframes:
+            # np.memmap cannot map zero bytes
+            return np.zeros((0, nch), dtype=np.int16), sr
+        return np.memmap(path, dtype=np.int16, mode='r', offset=data_off, shape=(nframes, nch)), sr
 
 # ---------------- FFmpeg worker (generalized for audio/video tasks) ----------------
+class JobLimiter:
+    """Context manager admitting at most limit holders at once.
+
+    Unlike a semaphore the limit can change while slots are held: lowering it
+    lets running jobs finish and only admits new ones once the count is under
+    the new limit.
+    """
+
+    def __init__(self, limit: int):
+        self._cond = threading.Condition()
+        self._limit = max(1, limit)
+        self._active = 0
+
+    def set_limit(self, limit: int):
+        with self._cond:
+            self._limit = max(1, limit)
+            self._cond.notify_all()
+
+    def __enter__(self):
+        with self._cond:
+            while self._active >= self._limit:
+                self._cond.wait()
+            self._active += 1
+        return self
+
+    def __exit__(self, *exc):
+        with self._cond:
+            self._active -= 1
+            self._cond.notify()
+        return False
+
 class Worker(threading.Thread):
-    def __init__(self, task: Task, bands: List[Band], ui_queue: queue.Queue):
+    def __init__(self, task: Task, bands: List[Band], ui_queue: queue.Queue, slots: Optional[JobLimiter] = None, threads: int = 0):
         super().__init__(daemon=True)
         self.task = task
         self.bands = bands
         self.ui_queue = ui_queue
+        self.slots = slots
+        self.threads = threads  # ffmpeg -threads per command; 0 leaves ffmpeg's default
+        self.cancelled = threading.Event()
         self._proc = None
 
     def run(self):
         try:
-            if self.task.action == 'apply_eq':
-                self._apply_eq()
-            elif self.task.action == 'extract_audio':
-                self._extract_audio()
-            elif self.task.action == 'convert_video':
-                self._convert_video()
-            elif self.task.action == 'convert_audio':
-                self._convert_audio()
-            else:
-                self.ui_queue.put(('log', f'Unknown task action {self.task.action}'))
+            # wait for a free job slot; Stop All may cancel us while queued
+            with self.slots if self.slots is not None else contextlib.nullcontext():
+                if self.cancelled.is_set():
+                    return
+                self._dispatch()
         except Exception as e:
             self.ui_queue.put(('error', f'Worker exception: {e}\n{traceback.format_exc()}'))
         finally:
             self.ui_queue.put(('done', self.task.id))
 
+    def _dispatch(self):
+        if self.task.action == 'apply_eq':
+            self._apply_eq()
+        elif self.task.action == 'extract_audio':
+            self._extract_audio()
+        elif self.task.action == 'convert_video':
+            self._convert_video()
+        elif self.task.action == 'convert_audio':
+            self._convert_audio()
+        else:
+            self.ui_queue.put(('log', f'Unknown task action {self.task.action}'))
+
+    def _with_threads(self, cmd: List[str]) -> List[str]:
+        # -threads is a per-file option; the output is always the last argument
+        if not self.threads:
+            return cmd
+        return cmd[:-1] + ['-threads', str(self.threads), cmd[-1]]
+
     def _run_cmd_with_progress(self, cmd: List[str], input_path: Optional[str] = None):
         duration = ffprobe_duration(input_path) if input_path else 0.0
+        # machine-readable key=value progress on stdout instead of the stats line
+        cmd = cmd[:1] + FFMPEG_PROGRESS_ARGS + self._with_threads(cmd)[1:]
         self.ui_queue.put(('cmd', ' '.join(shlex.quote(c) for c in cmd)))
         try:
-            proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, bufsize=1)
+            proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, bufsize=0)
             self._proc = proc
             last_pct = 0.0
-            for line in proc.stdout:
-                line = line.strip()
-                self.ui_queue.put(('log', line))
-                t = None
-                if 'time=' in line:
-                    t = parse_ffmpeg_time(line)
-                if t is not None and duration > 0:
+            # raw bytes: only progress values are parsed here, log lines are
+            # decoded by the GUI thread
+            for line in iter_pipe_lines(proc.stdout.fileno()):
+                if not line.startswith(b'out_time_us='):
+                    # other progress fields (frame=, speed=, ...) are not logged
+                    if b'=' not in line or b' ' in line:
+                        self.ui_queue.put(('log', line))
+                    continue
+                try:
+                    t = int(line[12:]) / 1e6
+                except ValueError:
+                    # N/A until the first frame is written
+                    continue
+                if duration > 0:
                     pct = min(100.0, (t / duration) * 100.0)
                     if pct - last_pct >= 0.5 or pct == 100.0:
                         last_pct = pct
@@ -364,6 +913,65 @@ class Worker(threading.Thread):
         except Exception as e:
             self.ui_queue.put(('error', f'ffmpeg error: {e}'))
 
+    def _convolve_pipe(self, dec_cmd: List[str], enc_cmd: Optional[List[str]], fir: np.ndarray, nch: int, sr: int, block_size: int = 65536):
+        # decoder stdout -> overlap-add -> encoder stdin; all three run concurrently.
+        # Without enc_cmd the PCM is written to the output WAV directly.
+        total_frames = ffprobe_duration(self.task.input_path) * sr
+        dec_cmd = self._with_threads(dec_cmd)
+        if enc_cmd is not None:
+            enc_cmd = self._with_threads(enc_cmd)
+        dec_str = ' '.join(shlex.quote(c) for c in dec_cmd)
+        if enc_cmd is None:
+            self.ui_queue.put(('cmd', f'{dec_str} > {shlex.quote(self.task.output_path)}'))
+        else:
+            self.ui_queue.put(('cmd', dec_str + ' | ' + ' '.join(shlex.quote(c) for c in enc_cmd)))
+        dec = subprocess.Popen(dec_cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, bufsize=block_size * nch * 2 * 4)
+        self._proc = dec
+        enc = None
+        try:
+            if enc_cmd is None:
+                sink = WavWriter(self.task.output_path, nch, sr, expected_frames=int(total_frames) + len(fir) - 1)
+            else:
+                enc = subprocess.Popen(enc_cmd, stdin=subprocess.PIPE, stderr=subprocess.DEVNULL)
+                sink = enc.stdin
+        except BaseException:
+            dec.kill(); dec.wait()
+            raise
+        done = 0
+        last_pct = 0.0
+        # every yielded block, the convolution tail included, has at most block_size rows
+        int_scratch = np.empty((block_size, nch), dtype=np.int16)
+        try:
+            for y in ola_convolve_blocks(read_pcm_blocks(dec.stdout, nch, block_size), fir, nch, block_size):
+                m = y.shape[0]
+                np.clip(y, -32767, 32767, out=y)
+                np.copyto(int_scratch[:m], y, casting='unsafe')
+                sink.write(int_scratch[:m])
+                done += m
+                if total_frames > 0:
+                    pct = min(100.0, (done / total_frames) * 100.0)
+                    if pct - last_pct >= 0.5:
+                        last_pct = pct
+                        self.ui_queue.put(('progress', (self.task.id, pct)))
+        except BaseException:
+            dec.kill()
+            if enc is not None:
+                enc.kill()
+            raise
+        finally:
+            for stream in (sink, dec.stdout):
+                try:
+                    stream.close()
+                except OSError:
+                    pass
+            dec.wait()
+            if enc is not None:
+                enc.wait()
+        if dec.returncode != 0:
+            raise RuntimeError(f'ffmpeg decode returned {dec.returncode}')
+        if enc is not None and enc.returncode != 0:
+            raise RuntimeError(f'ffmpeg encode returned {enc.returncode}')
+
     def _apply_eq(self):
         opt = self.task.options
         use_fir = opt.get('use_fir', False)
@@ -372,7 +980,7 @@ class Worker(threading.Thread):
         fmt = opt.get('format', 'wav')
         if not use_fir:
             filters = build_ffmpeg_filter(self.bands)
-            cmd = [which_exe('ffmpeg') or 'ffmpeg', '-y', '-i', self.task.input_path]
+            cmd = [FFMPEG, '-y', '-i', self.task.input_path]
             if filters:
                 cmd += ['-af', filters]
             if fmt == 'mp3':
@@ -389,54 +997,30 @@ class Worker(threading.Thread):
             if not NP_AVAILABLE:
                 self.ui_queue.put(('error', 'numpy required for FIR export'))
                 return
-            tmp_dec = os.path.join(tempfile.gettempdir(), f'umc_dec_{int(time.time())}.wav')
-            tmp_conv = os.path.join(tempfile.gettempdir(), f'umc_conv_{int(time.time())}.wav')
-            # decode
-            cmd = [which_exe('ffmpeg') or 'ffmpeg', '-y', '-i', self.task.input_path, '-ar', str(sr), '-ac', str(ch), '-c:a', 'pcm_s16le', tmp_dec]
-            rc = subprocess.call(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-            if rc != 0:
-                self.ui_queue.put(('error', 'ffmpeg decode failed for FIR path'))
-                return
             # design FIR
             n_taps = int(opt.get('n_taps', 2048))
             self.ui_queue.put(('log', f'Designing FIR ({n_taps} taps)'))
-            fir = design_linear_phase_fir(self.bands, sr, n_taps)
-            # convolve
-            self.ui_queue.put(('log', 'Starting overlap-add convolution'))
-            try:
-                overlap_add_convolve_wav(tmp_dec, fir, tmp_conv, block_size=65536, ui_queue=self.ui_queue, task_id=self.task.id)
-            except Exception as e:
-                self.ui_queue.put(('error', f'Convolution failed: {e}'))
-                return
-            # encode
+            fir = cached_linear_phase_fir(self.bands, sr, n_taps)
+            # decoder and encoder are connected over pipes; no intermediate WAV files
+            pcm_args = ['-f', 's16le', '-ar', str(sr), '-ac', str(ch)]
+            dec_cmd = [FFMPEG, '-v', 'error', '-i', self.task.input_path] + pcm_args + ['pipe:1']
             if fmt == 'mp3':
-                cmd = [which_exe('ffmpeg') or 'ffmpeg', '-y', '-i', tmp_conv, '-ar', str(sr), '-ac', str(ch), '-c:a', 'libmp3lame', '-b:a', opt.get('mp3_bitrate', '192k'), self.task.output_path]
+                codec = ['-c:a', 'libmp3lame', '-b:a', opt.get('mp3_bitrate', '192k')]
             elif fmt == 'flac':
-                cmd = [which_exe('ffmpeg') or 'ffmpeg', '-y', '-i', tmp_conv, '-ar', str(sr), '-ac', str(ch), '-c:a', 'flac', self.task.output_path]
+                codec = ['-c:a', 'flac']
             elif fmt == 'aac':
-                cmd = [which_exe('ffmpeg') or 'ffmpeg', '-y', '-i', tmp_conv, '-ar', str(sr), '-ac', str(ch), '-c:a', 'aac', '-b:a', opt.get('aac_bitrate', '192k'), self.task.output_path]
+                codec = ['-c:a', 'aac', '-b:a', opt.get('aac_bitrate', '192k')]
             else:
-                # wav destination -> move tmp_conv
-                try:
-                    shutil.move(tmp_conv, self.task.output_path)
-                    tmp_conv = None
-                except Exception as e:
-                    self.ui_queue.put(('error', f'Failed move WAV: {e}'))
-                    return
-            if tmp_conv and os.path.exists(tmp_conv):
-                rc = subprocess.call(cmd)
-                if rc != 0:
-                    self.ui_queue.put(('error', 'ffmpeg re-encode failed after FIR'))
-                    return
-            # cleanup
-            try:
-                if os.path.exists(tmp_dec): os.remove(tmp_dec)
-            except Exception:
-                pass
+                # 16-bit WAV output needs no encoder
+                codec = None
+            enc_cmd = None if codec is None else [FFMPEG, '-y', '-v', 'error'] + pcm_args + ['-i', 'pipe:0'] + codec + [self.task.output_path]
+            self.ui_queue.put(('log', 'Starting overlap-add convolution'))
             try:
-                if tmp_conv and os.path.exists(tmp_conv): os.remove(tmp_conv)
-            except Exception:
-                pass
+                self._convolve_pipe(dec_cmd, enc_cmd, fir, ch, sr)
+            except Exception as e:
+                self.ui_queue.put(('error', f'FIR pipeline failed: {e}'))
+                return
+            self.ui_queue.put(('progress', (self.task.id, 100.0)))
             self.ui_queue.put(('log', f'FIR export complete: {self.task.output_path}'))
 
     def _extract_audio(self):
@@ -444,7 +1028,7 @@ class Worker(threading.Thread):
         fmt = opt.get('format', 'wav')
         sr = opt.get('sr', 44100)
         ch = opt.get('ch', 2)
-        cmd = [which_exe('ffmpeg') or 'ffmpeg', '-y', '-i', self.task.input_path, '-vn', '-ar', str(sr), '-ac', str(ch)]
+        cmd = [FFMPEG, '-y', '-i', self.task.input_path, '-vn', '-ar', str(sr), '-ac', str(ch)]
         if fmt == 'mp3':
             cmd += ['-c:a', 'libmp3lame', '-b:a', opt.get('mp3_bitrate','192k'), self.task.output_path]
         elif fmt == 'flac':
@@ -463,14 +1047,33 @@ class Worker(threading.Thread):
         audio_codec = opt.get('audio_codec', 'aac')
         video_bitrate = opt.get('video_bitrate', '1000k')
         audio_bitrate = opt.get('audio_bitrate', '128k')
+        preset = opt.get('preset', 'veryfast')
+        crf = str(opt.get('crf', '')).strip()
         
-        cmd = [which_exe('ffmpeg') or 'ffmpeg', '-y', '-i', self.task.input_path]
+        hw_family = video_codec.rpartition('_')[2]
+        device = hw_family in HW_DEVICE_INPUT_ARGS
+        if device and video_codec not in detect_hw_encoders():
+            self.ui_queue.put(('log', f'{video_codec} is not listed by this ffmpeg build; trying it anyway'))
+        hw_codec = pick_hw_encoder(video_codec) if opt.get('hw_encode', False) else None
+        cmd = [FFMPEG, '-y']
+        if device:
+            cmd += HW_DEVICE_INPUT_ARGS[hw_family]
+        elif hw_codec:
+            # decode on the GPU too when possible; ffmpeg falls back to software
+            cmd += ['-hwaccel', 'auto']
+        cmd += ['-i', self.task.input_path]
         
         # Video codec and quality
-        if video_codec == 'libx264':
-            cmd += ['-c:v', 'libx264', '-b:v', video_bitrate, '-preset', 'medium']
-        elif video_codec == 'libx265':
-            cmd += ['-c:v', 'libx265', '-b:v', video_bitrate, '-preset', 'medium']
+        if device:
+            cmd += HW_DEVICE_OUTPUT_ARGS.get(hw_family, [])
+            cmd += ['-c:v', video_codec] + HW_ENCODER_ARGS.get(video_codec, []) + ['-b:v', video_bitrate]
+        elif hw_codec:
+            self.ui_queue.put(('log', f'Using hardware encoder {hw_codec}'))
+            cmd += ['-c:v', hw_codec] + HW_ENCODER_ARGS.get(hw_codec, []) + ['-b:v', video_bitrate]
+        elif video_codec in ('libx264', 'libx265'):
+            cmd += ['-c:v', video_codec, '-preset', preset]
+            # CRF and a target bitrate are separate rate-control modes
+            cmd += ['-crf', crf] if crf else ['-b:v', video_bitrate]
         elif video_codec == 'vp9':
             cmd += ['-c:v', 'libvpx-vp9', '-b:v', video_bitrate]
         else:
@@ -496,7 +1099,7 @@ class Worker(threading.Thread):
         sr = opt.get('sr', 44100)
         ch = opt.get('ch', 2)
         
-        cmd = [which_exe('ffmpeg') or 'ffmpeg', '-y', '-i', self.task.input_path, '-ar', str(sr), '-ac', str(ch)]
+        cmd = [FFMPEG, '-y', '-i', self.task.input_path, '-ar', str(sr), '-ac', str(ch)]
         
         if fmt == 'mp3':
             cmd += ['-c:a', 'libmp3lame', '-b:a', opt.get('mp3_bitrate','192k'), self.task.output_path]
@@ -511,21 +1114,6 @@ class Worker(threading.Thread):
             
         self._run_cmd_with_progress(cmd, self.task.input_path)
 
-# Helper parse time
-
-def parse_ffmpeg_time(line: str) -> Optional[float]:
-    if 'time=' not in line:
-        return None
-    try:
-        seg = line.split('time=')[1].split(' ')[0]
-        parts = seg.split(':')
-        if len(parts) == 3:
-            h, m, s = parts
-            return float(h) * 3600 + float(m) * 60 + float(s)
-        return float(seg)
-    except Exception:
-        return None
-
 # Build ffmpeg filter
 
 def build_ffmpeg_filter(bands: List[Band]) -> str:
@@ -549,10 +1137,21 @@ class UnifiedApp:
         self.ui_queue: queue.Queue = queue.Queue()
         self._tasks: List[Task] = []
         self._workers: Dict[str, Worker] = {}
+        # shared by every worker; start_queue only adjusts its limit
+        self._job_slots = JobLimiter(DEFAULT_PARALLEL_JOBS)
         self.bands: List[Band] = []
+        # widgets of each band row, parallel to self.bands
+        self._band_rows: List[Dict[str, Any]] = []
         self.ab_a: Optional[List[Band]] = None
         self.ab_b: Optional[List[Band]] = None
         self._play_obj = None
+        # set whenever the bands change; the UI loop redraws at most once per tick
+        self._vis_dirty = True
+        # BandArray of the effective bands, dropped whenever they change
+        self._band_array_cache: Optional['BandArray'] = None
+        # the preset index is written at most once per second, and on close
+        self._presets_dirty = False
+        self._presets_flush_id = None
 
         self._build_ui()
         self._load_presets()
@@ -567,6 +1166,12 @@ class UnifiedApp:
         ttk.Button(top, text='Add Folder', command=self.add_folder).pack(side='left')
         ttk.Button(top, text='Start Queue', command=self.start_queue).pack(side='left', padx=6)
         ttk.Button(top, text='Stop All', command=self.stop_all).pack(side='left')
+        ttk.Label(top, text='Parallel jobs:').pack(side='left', padx=(12, 2))
+        self.max_jobs_var = tk.IntVar(value=DEFAULT_PARALLEL_JOBS)
+        ttk.Spinbox(top, from_=1, to=max(1, os.cpu_count() or 1), textvariable=self.max_jobs_var, width=4).pack(side='left')
+        ttk.Label(top, text='Threads/job:').pack(side='left', padx=(8, 2))
+        self.threads_var = tk.IntVar(value=DEFAULT_THREADS_PER_JOB)
+        ttk.Spinbox(top, from_=1, to=max(1, os.cpu_count() or 1), textvariable=self.threads_var, width=4).pack(side='left')
         ttk.Button(top, text='Save Preset', command=self.save_preset).pack(side='right')
         ttk.Button(top, text='Load Preset', command=self.load_preset).pack(side='right', padx=4)
         ttk.Button(top, text='Save FIR Coeffs', command=self.export_fir_coeffs_dialog).pack(side='right', padx=8)
@@ -612,13 +1217,12 @@ class UnifiedApp:
         # Right: visualiser, preview, logs
         vizf = ttk.LabelFrame(right, text='Visualizer & Preview')
         vizf.pack(fill='both', expand=True, padx=6, pady=6)
-        if MATPLOTLIB_AVAILABLE and NP_AVAILABLE:
-            self.figure = Figure(figsize=(5,3), dpi=120)
-            self.ax = self.figure.add_subplot(111)
-            self.canvas_fig = FigureCanvasTkAgg(self.figure, master=vizf)
-            self.canvas_fig.get_tk_widget().pack(fill='both', expand=True)
+        if NP_AVAILABLE:
+            self.viz_canvas = tk.Canvas(vizf, width=600, height=360, background='white', highlightthickness=0)
+            self.viz_canvas.pack(fill='both', expand=True)
+            self.viz_canvas.bind('<Configure>', lambda e: self._update_visualiser())
         else:
-            ttk.Label(vizf, text='Install numpy+matplotlib for visualiser').pack(padx=6, pady=6)
+            ttk.Label(vizf, text='Install numpy for visualiser').pack(padx=6, pady=6)
 
         pvf = ttk.Frame(right)
         pvf.pack(fill='x')
@@ -656,16 +1260,17 @@ class UnifiedApp:
         folder = filedialog.askdirectory(title='Select folder')
         if not folder:
             return
-        for root, dirs, files in os.walk(folder):
-            for f in files:
-                if Path(f).suffix.lower().lstrip('.') in ALL_FORMATS:
-                    self._add_file_to_queue(os.path.join(root, f))
+        # queue everything first; the task tree is rebuilt once at the end
+        for path in iter_media_files(folder):
+            self._add_file_to_queue(path, refresh=False)
+        self._refresh_task_tree()
 
-    def _add_file_to_queue(self, path: str):
+    def _add_file_to_queue(self, path: str, refresh: bool = True):
         tid = str(time.time()) + os.path.basename(path)
         t = Task(input_path=path, output_path='', action='pending', options={}, id=tid)
         self._tasks.append(t)
-        self._refresh_task_tree()
+        if refresh:
+            self._refresh_task_tree()
         self.log(f'Queued: {path}')
 
     def _refresh_task_tree(self):
@@ -734,14 +1339,16 @@ class UnifiedApp:
         browse_btn.pack(side='left', padx=5)
         
         # Update output entry when format changes
+        # (only the extension is derived here; Browse... opens the dialog)
         def update_output(*args):
-            base = Path(task.input_path).stem
+            src = Path(task.input_path)
             ext = fmt_var.get()
-            out_var.set(filedialog.asksaveasfilename(
-                initialfile=f"{base}.{ext}",
-                defaultextension=f".{ext}",
-                filetypes=[(f"{ext.upper()} files", f"*.{ext}")]
-            ))
+            cur = out_var.get()
+            target = Path(cur).with_suffix(f".{ext}") if cur else src.with_name(f"{src.stem}.{ext}")
+            if target == src:
+                # never default to overwriting the input
+                target = target.with_name(f"{src.stem}_converted.{ext}")
+            out_var.set(str(target))
         
         fmt_var.trace('w', update_output)
         
@@ -777,7 +1384,10 @@ class UnifiedApp:
         
         # Initialize video-specific variables with default values
         vcodec_var = tk.StringVar(value="libx264")
+        hwenc_var = tk.BooleanVar(value=False)
         vbitrate_var = tk.StringVar(value="1000k")
+        preset_var = tk.StringVar(value="veryfast")
+        crf_var = tk.StringVar(value="23")
         acodec_var = tk.StringVar(value="aac")
         
         # Video-specific options
@@ -787,8 +1397,9 @@ class UnifiedApp:
             vcodec_frame.pack(fill='x', pady=2)
             ttk.Label(vcodec_frame, text="Video Codec:").pack(side='left')
             vcodec_combo = ttk.Combobox(vcodec_frame, textvariable=vcodec_var,
-                                       values=["libx264", "libx265", "copy"], width=10)
+                                       values=VIDEO_CODECS, width=10)
             vcodec_combo.pack(side='left', padx=5)
+            ttk.Checkbutton(vcodec_frame, text="Hardware encoder if available", variable=hwenc_var).pack(side='left', padx=5)
             
             # Video bitrate
             vbitrate_frame = ttk.Frame(quality_frame)
@@ -798,6 +1409,16 @@ class UnifiedApp:
                                          values=["500k", "1000k", "2000k", "4000k"], width=10)
             vbitrate_combo.pack(side='left', padx=5)
             
+            # Encoder speed/quality (libx264/libx265 only)
+            preset_frame = ttk.Frame(quality_frame)
+            preset_frame.pack(fill='x', pady=2)
+            ttk.Label(preset_frame, text="Preset:").pack(side='left')
+            preset_combo = ttk.Combobox(preset_frame, textvariable=preset_var,
+                                       values=X264_PRESETS, width=10)
+            preset_combo.pack(side='left', padx=5)
+            ttk.Label(preset_frame, text="CRF (blank = bitrate):").pack(side='left')
+            ttk.Entry(preset_frame, textvariable=crf_var, width=5).pack(side='left', padx=5)
+            
             # Audio codec for video
             acodec_frame = ttk.Frame(quality_frame)
             acodec_frame.pack(fill='x', pady=2)
@@ -831,15 +1452,7 @@ class UnifiedApp:
             # Determine action based on input/output types
             input_type = get_file_type(task.input_path)
             output_type = get_file_type(output_path)
-            
-            if input_type == 'video' and output_type == 'video':
-                action = 'convert_video'
-            elif input_type == 'video' and output_type == 'audio':
-                action = 'extract_audio'
-            elif input_type == 'audio' and output_type == 'audio':
-                action = 'convert_audio'
-            else:
-                action = 'apply_eq'  # Default to EQ processing
+            action = EXPORT_ACTIONS.get((input_type, output_type), 'apply_eq')  # Default to EQ processing
             
             # Build options
             options = {
@@ -851,17 +1464,17 @@ class UnifiedApp:
             }
             
             # Add bitrate options
-            if options['format'] in ['mp3']:
-                options['mp3_bitrate'] = bitrate_var.get()
-            elif options['format'] in ['aac']:
-                options['aac_bitrate'] = bitrate_var.get()
-            elif options['format'] in ['ogg']:
-                options['ogg_bitrate'] = bitrate_var.get()
+            bitrate_key = BITRATE_OPTION_KEYS.get(options['format'])
+            if bitrate_key:
+                options[bitrate_key] = bitrate_var.get()
                 
             # Add video-specific options
             if action == 'convert_video':
                 options['video_codec'] = vcodec_var.get()
+                options['hw_encode'] = hwenc_var.get()
                 options['video_bitrate'] = vbitrate_var.get()
+                options['preset'] = preset_var.get()
+                options['crf'] = crf_var.get()
                 options['audio_codec'] = acodec_var.get()
                 options['audio_bitrate'] = bitrate_var.get()
             
@@ -891,13 +1504,33 @@ class UnifiedApp:
         if file_path:
             out_var.set(file_path)
 
+    def _get_job_slots(self, threads: int) -> JobLimiter:
+        # one limiter for all jobs, running or queued, so a new limit counts
+        # the jobs already holding a slot; jobs x threads never exceeds the cores
+        try:
+            limit = max(1, int(self.max_jobs_var.get()))
+        except (tk.TclError, ValueError):
+            limit = DEFAULT_PARALLEL_JOBS
+        self._job_slots.set_limit(min(limit, max(1, (os.cpu_count() or 2) // threads)))
+        return self._job_slots
+
+    def _get_threads_per_job(self) -> int:
+        try:
+            return max(1, int(self.threads_var.get()))
+        except (tk.TclError, ValueError):
+            return DEFAULT_THREADS_PER_JOB
+
     def start_queue(self):
-        # start any pending tasks sequentially or in parallel
+        # start any pending tasks; at most max_jobs_var run at once (fewer if
+        # threads_var would oversubscribe the cores), each ffmpeg limited to
+        # threads_var threads
+        threads = self._get_threads_per_job()
+        slots = self._get_job_slots(threads)
         for t in list(self._tasks):
             if t.action in ('apply_eq', 'extract_audio', 'convert_video', 'convert_audio'):
                 if t.id not in self._workers:
-                    bands_eff = self._effective_bands() if t.options.get('use_eq', True) else []
-                    worker = Worker(t, bands_eff, self.ui_queue)
+                    bands_eff = self._effective_bands_copy() if t.options.get('use_eq', True) else []
+                    worker = Worker(t, bands_eff, self.ui_queue, slots, threads)
                     self._workers[t.id] = worker
                     worker.start()
                     self.log(f'Started task: {t.input_path} -> {t.output_path}')
@@ -906,6 +1539,7 @@ class UnifiedApp:
     def stop_all(self):
         # try to terminate ffmpeg procs by killing children workers' processes
         for w in self._workers.values():
+            w.cancelled.set()
             try:
                 if getattr(w, '_proc', None):
                     w._proc.kill()
@@ -920,74 +1554,108 @@ class UnifiedApp:
         self._render_bands()
 
     def _render_bands(self):
-        for c in self.band_container.winfo_children():
-            c.destroy()
-        for i, b in enumerate(self.bands):
-            fr = ttk.Frame(self.band_container)
-            fr.pack(fill='x', pady=2)
-            ttk.Label(fr, text=f'#{i+1}').pack(side='left', padx=4)
-            tvar = tk.StringVar(value=b.type)
-            cb = ttk.Combobox(fr, values=['parametric','highpass','lowpass'], textvariable=tvar, width=10, state='readonly')
-            cb.pack(side='left')
-            fvar = tk.StringVar(value=str(int(b.f)))
-            ttk.Entry(fr, textvariable=fvar, width=8).pack(side='left', padx=6)
-            wvar = tk.StringVar(value=str(b.width))
-            ttk.Entry(fr, textvariable=wvar, width=6).pack(side='left', padx=6)
-            gvar = tk.DoubleVar(value=b.g)
-            ttk.Scale(fr, from_=-24, to=24, variable=gvar, orient='horizontal', length=160).pack(side='left', padx=6)
-            mute_btn = ttk.Button(fr, text='Mute' if not b.muted else 'Muted', width=6, command=lambda idx=i: self._toggle_mute(idx))
-            mute_btn.pack(side='right', padx=4)
-            solo_btn = ttk.Button(fr, text='Solo' if not b.solo else 'Soloed', width=6, command=lambda idx=i: self._toggle_solo(idx))
-            solo_btn.pack(side='right')
-            inv_btn = ttk.Button(fr, text='Invert' if not b.invert else 'Inverted', width=8, command=lambda idx=i: self._toggle_invert(idx))
-            inv_btn.pack(side='right', padx=4)
-            rm = ttk.Button(fr, text='Remove', command=lambda idx=i: self._remove_band(idx))
-            rm.pack(side='right', padx=4)
-            cb.bind('<<ComboboxSelected>>', lambda e, idx=i, tv=tvar: self._set_band(idx, 'type', tv.get()))
-            fvar.trace_add('write', lambda *a, idx=i, vv=fvar: self._set_band(idx, 'f', vv.get()))
-            wvar.trace_add('write', lambda *a, idx=i, vv=wvar: self._set_band(idx, 'width', vv.get()))
-            gvar.trace_add('write', lambda *a, idx=i, vv=gvar: self._set_band(idx, 'g', vv.get()))
-        self._update_visualiser()
+        # full rebuild, for when the whole band list is replaced
+        for row in self._band_rows:
+            row['frame'].destroy()
+        self._band_rows = []
+        for b in self.bands:
+            self._append_band_row(b)
+        self._bands_changed()
+
+    def _append_band_row(self, b: Band):
+        # callbacks read the row's current index at call time; removing a
+        # band renumbers the rows below it instead of rebuilding them
+        row: Dict[str, Any] = {'index': len(self._band_rows)}
+        def idx():
+            return row['index']
+        fr = ttk.Frame(self.band_container)
+        fr.pack(fill='x', pady=2)
+        label = ttk.Label(fr, text=f'#{len(self._band_rows)+1}')
+        label.pack(side='left', padx=4)
+        tvar = tk.StringVar(value=b.type)
+        cb = ttk.Combobox(fr, values=['parametric','highpass','lowpass'], textvariable=tvar, width=10, state='readonly')
+        cb.pack(side='left')
+        fvar = tk.StringVar(value=str(int(b.f)))
+        ttk.Entry(fr, textvariable=fvar, width=8).pack(side='left', padx=6)
+        wvar = tk.StringVar(value=str(b.width))
+        ttk.Entry(fr, textvariable=wvar, width=6).pack(side='left', padx=6)
+        gvar = tk.DoubleVar(value=b.g)
+        ttk.Scale(fr, from_=-24, to=24, variable=gvar, orient='horizontal', length=160).pack(side='left', padx=6)
+        mute_btn = ttk.Button(fr, text='Mute' if not b.muted else 'Muted', width=6, command=lambda: self._toggle_mute(idx()))
+        mute_btn.pack(side='right', padx=4)
+        solo_btn = ttk.Button(fr, text='Solo' if not b.solo else 'Soloed', width=6, command=lambda: self._toggle_solo(idx()))
+        solo_btn.pack(side='right')
+        inv_btn = ttk.Button(fr, text='Invert' if not b.invert else 'Inverted', width=8, command=lambda: self._toggle_invert(idx()))
+        inv_btn.pack(side='right', padx=4)
+        rm = ttk.Button(fr, text='Remove', command=lambda: self._remove_band(idx()))
+        rm.pack(side='right', padx=4)
+        cb.bind('<<ComboboxSelected>>', lambda e: self._set_band(idx(), 'type', tvar.get()))
+        fvar.trace_add('write', lambda *a: self._set_band(idx(), 'f', fvar.get()))
+        wvar.trace_add('write', lambda *a: self._set_band(idx(), 'width', wvar.get()))
+        gvar.trace_add('write', lambda *a: self._set_band(idx(), 'g', gvar.get()))
+        row.update(frame=fr, label=label, tvar=tvar, fvar=fvar, wvar=wvar, gvar=gvar,
+                   mute_btn=mute_btn, solo_btn=solo_btn, inv_btn=inv_btn)
+        self._band_rows.append(row)
 
     def add_band(self):
         self.bands.append(Band())
-        self._render_bands()
+        self._append_band_row(self.bands[-1])
+        self._bands_changed()
 
     def _remove_band(self, idx):
         if 0 <= idx < len(self.bands):
             self.bands.pop(idx)
-            self._render_bands()
+            self._band_rows.pop(idx)['frame'].destroy()
+            for i in range(idx, len(self._band_rows)):
+                self._band_rows[i]['index'] = i
+                self._band_rows[i]['label'].config(text=f'#{i+1}')
+            self._bands_changed()
 
     def _toggle_mute(self, idx):
-        self.bands[idx].muted = not self.bands[idx].muted
-        self._render_bands()
+        b = self.bands[idx]
+        b.muted = not b.muted
+        self._band_rows[idx]['mute_btn'].config(text='Muted' if b.muted else 'Mute')
+        self._bands_changed()
 
     def _toggle_solo(self, idx):
-        self.bands[idx].solo = not self.bands[idx].solo
-        self._render_bands()
+        b = self.bands[idx]
+        b.solo = not b.solo
+        self._band_rows[idx]['solo_btn'].config(text='Soloed' if b.solo else 'Solo')
+        self._bands_changed()
 
     def _toggle_invert(self, idx):
-        self.bands[idx].invert = not self.bands[idx].invert
-        self._render_bands()
+        b = self.bands[idx]
+        b.invert = not b.invert
+        self._band_rows[idx]['inv_btn'].config(text='Inverted' if b.invert else 'Invert')
+        self._bands_changed()
 
     def _set_band(self, idx, field, value):
         try:
-            if field == 'type':
-                self.bands[idx].type = value
-            elif field == 'f':
-                self.bands[idx].f = float(value)
-            elif field == 'width':
-                self.bands[idx].width = float(value)
-            elif field == 'g':
-                self.bands[idx].g = float(value)
+            setattr(self.bands[idx], field, BAND_FIELD_PARSERS[field](value))
         except Exception:
-            pass
-        self._update_visualiser()
+            # half-typed entries (e.g. '' or '1e') keep the previous value
+            return
+        self._bands_changed()
+
+    def _bands_changed(self):
+        self._vis_dirty = True
+        self._band_array_cache = None
 
     def _effective_bands(self) -> List[Band]:
+        # the GUI's own Band objects; only read them on the Tk thread
         if any(b.solo for b in self.bands):
-            return [b.copy() for b in self.bands if b.solo]
-        return [b.copy() for b in self.bands if not b.muted]
+            return [b for b in self.bands if b.solo]
+        return [b for b in self.bands if not b.muted]
+
+    def _effective_bands_copy(self) -> List[Band]:
+        # snapshot for work running on another thread
+        return [b.copy() for b in self._effective_bands()]
+
+    def _bands_to_array(self) -> 'BandArray':
+        # the effective bands as a BandArray, rebuilt only after _bands_changed
+        if self._band_array_cache is None:
+            self._band_array_cache = BandArray.from_bands(self._effective_bands())
+        return self._band_array_cache
 
     # ---------------- Preview and A/B features ----------------
     def preview_choice_threaded(self):
@@ -995,32 +1663,30 @@ class UnifiedApp:
         threading.Thread(target=lambda: self._preview(use_fir), daemon=True).start()
 
     def _preview(self, use_fir: bool = False):
+        # every path renders straight from the source: ffmpeg trims, resamples
+        # and filters in one pass, with no intermediate WAV on disk
         try:
             self._set_all_buttons_state('disabled')
             src = filedialog.askopenfilename(title='Select source for preview')
             if not src:
                 return
-            tmp_in = os.path.join(tempfile.gettempdir(), f'umc_preview_in_{int(time.time())}.wav')
-            cmd = [which_exe('ffmpeg') or 'ffmpeg', '-y', '-i', src, '-t', str(PREVIEW_DURATION), '-ar', '44100', '-ac', '2', '-c:a', 'pcm_s16le', tmp_in]
-            self.log('Rendering source...')
-            rc = subprocess.call(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-            if rc != 0:
-                self.log('ffmpeg failed')
-                return
+            tmp_out = os.path.join(tempfile.gettempdir(), f'umc_preview_out_{int(time.time())}.wav')
             if use_fir:
                 if not NP_AVAILABLE:
                     self.log('numpy required for FIR preview')
                     return
                 taps = max(64, 2048)
                 self.log('Designing FIR (preview)...')
-                fir = design_linear_phase_fir(self._effective_bands(), 44100, taps)
-                tmp_out = os.path.join(tempfile.gettempdir(), f'umc_preview_out_{int(time.time())}.wav')
-                overlap_add_convolve_wav(tmp_in, fir, tmp_out, block_size=65536, ui_queue=self.ui_queue, task_id='preview')
+                # memoized: repeated previews of the same settings skip the design
+                fir = cached_linear_phase_fir(self._effective_bands_copy(), 44100, taps)
+                if not self._afir_preview(src, fir, tmp_out):
+                    self.log('ffmpeg afir failed, convolving with ' + ('scipy' if SCIPY_AVAILABLE else 'numpy'))
+                    self._convolve_preview_pipe(src, fir, tmp_out)
                 self._play_file(tmp_out)
             else:
-                filters = build_ffmpeg_filter(self._effective_bands())
-                tmp_out = os.path.join(tempfile.gettempdir(), f'umc_preview_out_{int(time.time())}.wav')
-                cmd = [which_exe('ffmpeg') or 'ffmpeg', '-y', '-i', tmp_in]
+                filters = build_ffmpeg_filter(self._effective_bands_copy())
+                self.log('Rendering preview...')
+                cmd = [FFMPEG, '-y', '-i', src, '-t', str(PREVIEW_DURATION)]
                 if filters:
                     cmd += ['-af', filters]
                 cmd += ['-ar', '44100', '-ac', '2', '-c:a', 'pcm_s16le', tmp_out]
@@ -1034,21 +1700,90 @@ class UnifiedApp:
         finally:
             self._set_all_buttons_state('normal')
 
+    def _afir_preview(self, src: str, fir: np.ndarray, tmp_out: str) -> bool:
+        # ffmpeg's afir (threaded C) is much faster than the Python convolution
+        # for a short clip; the taps go in as raw mono float32, and irnorm=-1
+        # keeps the designed gain instead of renormalising the IR. The source
+        # is brought to 44.1 kHz stereo in the same graph.
+        ir_path = os.path.join(tempfile.gettempdir(), f'umc_preview_ir_{int(time.time())}.f32')
+        try:
+            np.asarray(fir, dtype='<f4').tofile(ir_path)
+            cmd = [FFMPEG, '-y', '-i', src, '-f', 'f32le', '-ar', '44100', '-ac', '1', '-i', ir_path,
+                   '-filter_complex', '[0:a]aresample=44100,aformat=channel_layouts=stereo[src];[src][1:a]afir=irnorm=-1',
+                   '-t', str(PREVIEW_DURATION), '-ar', '44100', '-ac', '2', '-c:a', 'pcm_s16le', tmp_out]
+            return subprocess.call(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL) == 0
+        except OSError:
+            return False
+        finally:
+            try:
+                os.remove(ir_path)
+            except OSError:
+                pass
+
+    def _convolve_preview_pipe(self, src: str, fir: np.ndarray, tmp_out: str, block_size: int = 65536):
+        # fallback: decoded PCM is read from ffmpeg's stdout and convolved
+        # into the output WAV; the clip is short, so with scipy it is read
+        # whole and convolved in one oaconvolve call, otherwise block by block
+        cmd = [FFMPEG, '-v', 'error', '-i', src, '-t', str(PREVIEW_DURATION),
+               '-f', 's16le', '-ar', '44100', '-ac', '2', 'pipe:1']
+        dec = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+        int_scratch = np.empty((block_size, 2), dtype=np.int16)
+        try:
+            with WavWriter(tmp_out, 2, 44100, expected_frames=PREVIEW_DURATION * 44100 + len(fir) - 1) as sink:
+                if SCIPY_AVAILABLE:
+                    from scipy.signal import oaconvolve
+                    raw = dec.stdout.read()
+                    pcm = np.frombuffer(raw, dtype=np.int16, count=len(raw) // 4 * 2).reshape(-1, 2)
+                    if len(pcm):
+                        y = oaconvolve(pcm.astype(np.float32), np.asarray(fir, dtype=np.float32)[:, None], mode='full', axes=0)
+                        sink.write(np.clip(y, -32767, 32767, out=y).astype(np.int16))
+                else:
+                    for y in ola_convolve_blocks(read_pcm_blocks(dec.stdout, 2, block_size), fir, 2, block_size):
+                        m = y.shape[0]
+                        np.clip(y, -32767, 32767, out=y)
+                        np.copyto(int_scratch[:m], y, casting='unsafe')
+                        sink.write(int_scratch[:m])
+        finally:
+            dec.stdout.close()
+            dec.wait()
+        if dec.returncode != 0:
+            raise RuntimeError(f'ffmpeg decode returned {dec.returncode}')
+
     def _play_file(self, path: str):
         try:
-            if not SIMPLEAUDIO_AVAILABLE:
-                self.log('simpleaudio not installed')
+            backend = _get_audio_backend()
+            if backend is None:
+                self.log('No audio playback backend (pip install unified-media-converter[preview] or install ffplay)')
                 return
-            if getattr(self, '_play_obj', None):
-                try:
-                    self._play_obj.stop()
-                except Exception:
-                    pass
-            wobj = sa.WaveObject.from_wave_file(path)
-            self._play_obj = wobj.play()
+            self._stop_playback()
+            name, handle = backend
+            if name == 'simpleaudio':
+                self._play_obj = handle.WaveObject.from_wave_file(path).play()
+            elif name == 'sounddevice':
+                with wave.open(path, 'rb') as wf:
+                    nch = wf.getnchannels(); sr = wf.getframerate()
+                    raw = wf.readframes(wf.getnframes())
+                handle.play(np.frombuffer(raw, dtype=np.int16).reshape(-1, nch), sr)
+                self._play_obj = handle
+            else:
+                self._play_obj = subprocess.Popen([handle, '-nodisp', '-autoexit', '-loglevel', 'quiet', path],
+                                                  stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
         except Exception as e:
             self.log(f'Play error: {e}')
 
+    def _stop_playback(self):
+        obj = getattr(self, '_play_obj', None)
+        if obj is None:
+            return
+        try:
+            if isinstance(obj, subprocess.Popen):
+                obj.terminate()
+            else:
+                obj.stop()
+        except Exception:
+            pass
+        self._play_obj = None
+
     def ab_crossfade_threaded(self):
         threading.Thread(target=self._ab_crossfade, daemon=True).start()
 
@@ -1063,7 +1798,7 @@ class UnifiedApp:
                 return
             # render base
             tmp_in = os.path.join(tempfile.gettempdir(), f'umc_ab_in_{int(time.time())}.wav')
-            cmd = [which_exe('ffmpeg') or 'ffmpeg', '-y', '-i', src, '-t', str(PREVIEW_DURATION), '-ar', '44100', '-ac', '2', '-c:a', 'pcm_s16le', tmp_in]
+            cmd = [FFMPEG, '-y', '-i', src, '-t', str(PREVIEW_DURATION), '-ar', '44100', '-ac', '2', '-c:a', 'pcm_s16le', tmp_in]
             rc = subprocess.call(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
             if rc != 0:
                 self.log('ffmpeg failed to render base')
@@ -1073,41 +1808,46 @@ class UnifiedApp:
             tmp_b = os.path.join(tempfile.gettempdir(), f'umc_ab_b_{int(time.time())}.wav')
             filters_a = build_ffmpeg_filter(self.ab_a)
             filters_b = build_ffmpeg_filter(self.ab_b)
-            cmd_a = [which_exe('ffmpeg') or 'ffmpeg', '-y', '-i', tmp_in]
+            cmd_a = [FFMPEG, '-y', '-i', tmp_in]
             if filters_a: cmd_a += ['-af', filters_a]
             cmd_a += ['-ar', '44100', '-ac', '2', '-c:a', 'pcm_s16le', tmp_a]
-            cmd_b = [which_exe('ffmpeg') or 'ffmpeg', '-y', '-i', tmp_in]
+            cmd_b = [FFMPEG, '-y', '-i', tmp_in]
             if filters_b: cmd_b += ['-af', filters_b]
             cmd_b += ['-ar', '44100', '-ac', '2', '-c:a', 'pcm_s16le', tmp_b]
             subprocess.call(cmd_a, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
             subprocess.call(cmd_b, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
             # mix crossfade
-            with wave.open(tmp_a, 'rb') as wa, wave.open(tmp_b, 'rb') as wb:
-                nch = wa.getnchannels(); sr = wa.getframerate()
-                a_raw = wa.readframes(wa.getnframes())
-                b_raw = wb.readframes(wb.getnframes())
             if NP_AVAILABLE:
-                a_arr = np.frombuffer(a_raw, dtype=np.int16).astype(np.float32).reshape(-1, nch)
-                b_arr = np.frombuffer(b_raw, dtype=np.int16).astype(np.float32).reshape(-1, nch)
-                L = max(a_arr.shape[0], b_arr.shape[0])
-                def pad(a):
-                    if a.shape[0] < L:
-                        return np.vstack([a, np.zeros((L - a.shape[0], a.shape[1]))])
-                    return a[:L]
-                a_arr = pad(a_arr); b_arr = pad(b_arr)
-                t = np.linspace(0,1,L)[:,None]
-                out = a_arr * (1 - t) + b_arr * t
-                maxv = np.max(np.abs(out));
+                # the renders are mapped, not read, and widened straight into the float buffers
+                a_pcm, sr = map_wav_pcm(tmp_a)
+                b_pcm, _ = map_wav_pcm(tmp_b)
+                nch = a_pcm.shape[1]
+                L = max(a_pcm.shape[0], b_pcm.shape[0])
+                # zero-padded float32 copies; everything below works in these two buffers
+                a_arr = np.zeros((L, nch), dtype=np.float32)
+                b_arr = np.zeros((L, nch), dtype=np.float32)
+                a_arr[:a_pcm.shape[0]] = a_pcm
+                b_arr[:b_pcm.shape[0]] = b_pcm
+                # equal-power (cos/sin) gains keep the loudness constant through
+                # the fade; the envelopes are cached per length
+                fade_out, fade_in = equal_power_fades(L)
+                np.multiply(a_arr, fade_out, out=a_arr)
+                np.multiply(b_arr, fade_in, out=b_arr)
+                np.add(b_arr, a_arr, out=b_arr)
+                maxv = np.abs(b_arr, out=a_arr).max()
                 if maxv < 1e-9: maxv = 1.0
-                out_int = (out * (32767.0 / maxv)).astype(np.int16)
+                np.multiply(b_arr, np.float32(32767.0 / maxv), out=b_arr)
+                out_int = b_arr.astype(np.int16)
+                del a_pcm, b_pcm
             else:
                 # Fallback when numpy is not available - just play one of the files
                 self._play_file(tmp_a)
                 return
             tmp_out = os.path.join(tempfile.gettempdir(), f'umc_ab_xfade_{int(time.time())}.wav')
-            with wave.open(tmp_out, 'wb') as wf:
-                wf.setnchannels(nch); wf.setsampwidth(2); wf.setframerate(sr)
-                wf.writeframes(out_int.tobytes())
+            # the size is known up front: header and samples in two writes
+            with open(tmp_out, 'wb') as fh:
+                fh.write(wav_header(nch, sr, out_int.nbytes))
+                fh.write(out_int)
             self._play_file(tmp_out)
         except Exception as e:
             self.log(f'AB crossfade error: {e}')
@@ -1127,7 +1867,7 @@ class UnifiedApp:
             n_taps = int(simpledialog := None or 2048)
         except Exception:
             pass
-        coeffs = design_linear_phase_fir(self._effective_bands(), 44100, n_taps)
+        coeffs = cached_linear_phase_fir(self._effective_bands(), 44100, n_taps)
         with open(csv_path, 'w', encoding='utf-8') as fh:
             fh.write('index,coef\n')
             for i, c in enumerate(coeffs):
@@ -1137,13 +1877,19 @@ class UnifiedApp:
         wav_ir = base + '_IR.wav'
         with open(raw_path, 'wb') as fh:
             fh.write(coeffs.astype(np.float32).tobytes())
-        cmd = [which_exe('ffmpeg') or 'ffmpeg', '-y', '-f', 'f32le', '-ar', '44100', '-ac', '1', '-i', raw_path, wav_ir]
+        cmd = [FFMPEG, '-y', '-f', 'f32le', '-ar', '44100', '-ac', '1', '-i', raw_path, wav_ir]
         rc = subprocess.call(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
         if rc == 0:
             self.log(f'IR WAV generated: {wav_ir}')
         else:
             self.log('IR WAV generation failed (but .f32/.csv are available)')
 
+    def on_close(self):
+        if self._presets_flush_id is not None:
+            self.root.after_cancel(self._presets_flush_id)
+        self._flush_presets()
+        self.root.destroy()
+
     # ---------------- Presets ----------------
     def _load_presets(self):
         if PRESETS_FILE.exists():
@@ -1153,12 +1899,23 @@ class UnifiedApp:
             except Exception:
                 self._preset_store = {'presets': []}
         else:
+            # created by the first save
             self._preset_store = {'presets': []}
-            try:
-                with open(PRESETS_FILE, 'w', encoding='utf-8') as fh:
-                    json.dump(self._preset_store, fh, indent=2)
-            except Exception:
-                pass
+
+    def _flush_presets(self):
+        self._presets_flush_id = None
+        if not self._presets_dirty:
+            return
+        # write a sibling file and swap it in, so a crash never leaves a
+        # truncated index behind
+        tmp = PRESETS_FILE.with_suffix('.tmp')
+        try:
+            with open(tmp, 'w', encoding='utf-8') as fh:
+                json.dump(self._preset_store, fh, indent=2)
+            os.replace(tmp, PRESETS_FILE)
+            self._presets_dirty = False
+        except OSError as e:
+            self.log(f'Could not write {PRESETS_FILE}: {e}')
 
     def save_preset(self):
         name = filedialog.asksaveasfilename(defaultextension='.json', filetypes=[('Preset','*.json')])
@@ -1168,8 +1925,9 @@ class UnifiedApp:
         with open(name, 'w', encoding='utf-8') as fh:
             json.dump(payload, fh, indent=2)
         self._preset_store.setdefault('presets', []).append({'name': os.path.basename(name), 'file': name})
-        with open(PRESETS_FILE, 'w', encoding='utf-8') as fh:
-            json.dump(self._preset_store, fh, indent=2)
+        self._presets_dirty = True
+        if self._presets_flush_id is None:
+            self._presets_flush_id = self.root.after(1000, self._flush_presets)
         self.log(f'Preset saved: {name}')
 
     def load_preset(self):
@@ -1210,53 +1968,81 @@ class UnifiedApp:
         self.root.after(200, self._ui_loop)
 
     def _ui_loop(self):
+        # drain everything queued since the last tick, then touch the widgets
+        # once: all log lines in one insert, only the latest progress per task
+        log_lines = []
+        progress = {}
         try:
             while True:
                 typ, payload = self.ui_queue.get_nowait()
                 if typ == 'log':
-                    self.log(payload)
+                    if isinstance(payload, bytes):
+                        payload = payload.decode('utf-8', 'replace')
+                    log_lines.append(payload)
                 elif typ == 'cmd':
-                    self.log('CMD: ' + payload)
+                    log_lines.append('CMD: ' + payload)
                 elif typ == 'progress':
                     task_id, pct = payload
-                    self.global_progress['value'] = pct
-                    if self.task_tree.exists(task_id):
-                        self.task_tree.set(task_id, 'progress', f'{pct:.1f}%')
+                    progress.pop(task_id, None)
+                    progress[task_id] = pct
                 elif typ == 'error':
-                    self.log('ERROR: ' + payload)
-                    self.root.after(0, lambda: messagebox.showerror(APP_TITLE, payload))
+                    log_lines.append('ERROR: ' + payload)
+                    self.root.after(0, lambda payload=payload: messagebox.showerror(APP_TITLE, payload))
                 elif typ == 'done':
-                    self.log(f'Task {payload} done')
+                    log_lines.append(f'Task {payload} done')
         except queue.Empty:
             pass
-        # redraw visualiser periodically
-        self._update_visualiser()
+        if log_lines:
+            self._log_lines(log_lines)
+        for task_id, pct in progress.items():
+            if self.task_tree.exists(task_id):
+                self.task_tree.set(task_id, 'progress', f'{pct:.1f}%')
+        if progress:
+            # the bar follows whichever task reported last
+            self.global_progress['value'] = pct
+        # redraw the visualiser only after the bands changed
+        if self._vis_dirty:
+            self._vis_dirty = False
+            self._update_visualiser()
         self.root.after(200, self._ui_loop)
 
+    def _response_curves(self, num: int = 2048):
+        """Log-spaced frequencies with total and per-band magnitudes in dB."""
+        fs = VIS_FS
+        freqs = np.logspace(math.log10(VIS_FREQ_RANGE[0]), math.log10(VIS_FREQ_RANGE[1]), num=num)
+        H_per = compute_per_band_responses(self._bands_to_array(), freqs, fs)
+        total = 20 * np.log10(np.maximum(np.abs(np.prod(H_per, axis=0)), 1e-12))
+        per_band = 20 * np.log10(np.maximum(np.abs(H_per), 1e-12))
+        return freqs, total, per_band
+
     def _update_visualiser(self):
-        if not (MATPLOTLIB_AVAILABLE and NP_AVAILABLE and hasattr(self, 'ax')):
+        if not (NP_AVAILABLE and hasattr(self, 'viz_canvas')):
             return
         try:
-            fs = 4100.0
-            if NP_AVAILABLE:
-                freqs = np.logspace(math.log10(20.0), math.log10(20000.0), num=2048)
-                H = compute_total_response(self._effective_bands(), freqs, fs)
-                mag = 20 * np.log10(np.maximum(np.abs(H), 1e-12))
-                self.ax.clear(); self.ax.set_xscale('log'); self.ax.set_xlim(20,20000); self.ax.set_ylim(-36,36)
-                self.ax.grid(True, which='both', ls='--', alpha=0.3)
-                self.ax.plot(freqs, mag, linewidth=2)
-                for b in self._effective_bands():
-                    if b.type == 'parametric':
-                        Hb = peaking_eq_response(b, freqs, fs)
-                    elif b.type == 'lowpass':
-                        Hb = lowpass_response(b.f, freqs, fs)
-                    elif b.type == 'highpass':
-                        Hb = highpass_response(b.f, freqs, fs)
-                    else:
-                        Hb = np.ones_like(freqs)
-                    mb = 20 * np.log10(np.maximum(np.abs(Hb), 1e-12))
-                    self.ax.plot(freqs, mb, alpha=0.35)
-                self.canvas_fig.draw()
+            c = self.viz_canvas
+            w = max(c.winfo_width(), 2); h = max(c.winfo_height(), 2)
+            # one sample per pixel column is all the canvas can show
+            freqs, total, per_band = self._response_curves(num=max(64, min(2048, w)))
+            lx0 = math.log10(VIS_FREQ_RANGE[0])
+            lspan = math.log10(VIS_FREQ_RANGE[1]) - lx0
+            def x_of(f):
+                return (np.log10(f) - lx0) / lspan * (w - 1)
+            def y_of(db):
+                return (VIS_DB_LIMIT - np.clip(db, -VIS_DB_LIMIT, VIS_DB_LIMIT)) / (2 * VIS_DB_LIMIT) * (h - 1)
+            xs = x_of(freqs)
+            c.delete('all')
+            for f in (50, 100, 200, 500, 1000, 2000, 5000, 10000):
+                x = float(x_of(f))
+                c.create_line(x, 0, x, h, fill='#dddddd', dash=(2, 4))
+            for f, label in ((100, '100'), (1000, '1k'), (10000, '10k')):
+                c.create_text(float(x_of(f)) + 2, h - 2, text=label, anchor='sw', fill='#888888')
+            for db in range(-int(VIS_DB_LIMIT) + 12, int(VIS_DB_LIMIT), 12):
+                y = float(y_of(db))
+                c.create_line(0, y, w, y, fill='#dddddd', dash=(2, 4))
+                c.create_text(2, y - 1, text=f'{db:+d} dB', anchor='sw', fill='#888888')
+            for mb in per_band:
+                c.create_line(*np.column_stack([xs, y_of(mb)]).ravel().tolist(), fill='#a9c4de')
+            c.create_line(*np.column_stack([xs, y_of(total)]).ravel().tolist(), fill='#1f77b4', width=2)
         except Exception:
             pass
 
@@ -1272,32 +2058,29 @@ class UnifiedApp:
         set_state(self.root)
 
     def _on_drop(self, event):
-        data = event.data
-        parts = []
-        cur = ''
-        in_brace = False
-        for ch in data:
-            if ch == '{': in_brace = True; cur = ''
-            elif ch == '}': in_brace = False; parts.append(cur); cur = ''
-            elif in_brace: cur += ch
-            elif ch == ' ' and not in_brace: continue
-        if not parts and data:
-            parts = data.split()
+        # tkdnd sends a Tcl list: paths with spaces are {braced} or escaped,
+        # which Tcl's own list parser unpacks in one call
+        parts = self.root.tk.splitlist(event.data)
         for p in parts:
             if os.path.isdir(p):
-                self.add_folder_path(p)
+                self.add_folder_path(p, refresh=False)
             else:
-                self._add_file_to_queue(p)
+                self._add_file_to_queue(p, refresh=False)
+        self._refresh_task_tree()
 
-    def add_folder_path(self, folder: str):
-        for root, dirs, files in os.walk(folder):
-            for f in files:
-                if Path(f).suffix.lower().lstrip('.') in ALL_FORMATS:
-                    self._add_file_to_queue(os.path.join(root, f))
+    def add_folder_path(self, folder: str, refresh: bool = True):
+        for path in iter_media_files(folder):
+            self._add_file_to_queue(path, refresh=False)
+        if refresh:
+            self._refresh_task_tree()
 
     def log(self, text: str):
+        self._log_lines([text])
+
+    def _log_lines(self, texts: List[str]):
+        # one insert/see/trim round-trip for any number of lines
         ts = time.strftime('%H:%M:%S')
-        self.log_text.insert('end', f'[{ts}] {text}\n')
+        self.log_text.insert('end', ''.join(f'[{ts}] {t}\n' for t in texts))
         self.log_text.see('end')
         lines = int(self.log_text.index('end-1c').split('.')[0])
         if lines > LOG_MAX_LINES:
@@ -1305,13 +2088,21 @@ class UnifiedApp:
 
     # ---------------- Export visual ----------------
     def export_visual_png(self):
-        if not (MATPLOTLIB_AVAILABLE and NP_AVAILABLE and hasattr(self, 'figure')):
-            messagebox.showinfo('Export', 'matplotlib not available')
+        if not (NP_AVAILABLE and _load_matplotlib()):
+            messagebox.showinfo('Export', 'matplotlib not available (install the advanced-plots extra)')
             return
         path = filedialog.asksaveasfilename(defaultextension='.png', filetypes=[('PNG files', '*.png')])
         if path:
             try:
-                self.figure.savefig(path, dpi=300, bbox_inches='tight')
+                freqs, total, per_band = self._response_curves()
+                figure = Figure(figsize=(5,3), dpi=120)
+                ax = figure.add_subplot(111)
+                ax.set_xscale('log'); ax.set_xlim(*VIS_FREQ_RANGE); ax.set_ylim(-VIS_DB_LIMIT, VIS_DB_LIMIT)
+                ax.grid(True, which='both', ls='--', alpha=0.3)
+                ax.plot(freqs, total, linewidth=2)
+                for mb in per_band:
+                    ax.plot(freqs, mb, alpha=0.35)
+                figure.savefig(path, dpi=300, bbox_inches='tight')
                 self.log(f'Visual exported to: {path}')
             except Exception as e:
                 self.log(f'Export failed: {e}')
@@ -1346,7 +2137,7 @@ def main():
     if which_exe('ffmpeg') is None:
         print('Warning: ffmpeg not found in PATH. Install to enable processing.')
     app = UnifiedApp(root)
-    root.protocol('WM_DELETE_WINDOW', root.destroy)
+    root.protocol('WM_DELETE_WINDOW', app.on_close)
     root.mainloop()
 
 if __name__ == '__main__':
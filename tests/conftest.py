@@ -5,8 +5,12 @@ pytest configuration file for Unified Media Converter tests
 import sys
 from pathlib import Path
 
-# Add src to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+import pytest
+
+# Add src to path for imports (once; the test modules rely on this)
+SRC_DIR = str(Path(__file__).parent.parent / "src")
+if SRC_DIR not in sys.path:
+    sys.path.insert(0, SRC_DIR)
 
 # pytest configuration
 def pytest_configure(config):
@@ -21,43 +25,40 @@ def pytest_configure(config):
         "markers", "unit: marks tests as unit tests"
     )
 
-# Fixture for temporary directories
-import pytest
-import tempfile
-import shutil
+# Import the application module once, up front, so its import cost (Tk,
+# numpy, ...) is not charged to whichever test happens to run first
+@pytest.fixture(scope="session", autouse=True)
+def _warm_imports():
+    """Import the application module at session start."""
+    import importlib
+    try:
+        importlib.import_module("unified_media_converter")
+    except Exception:
+        # e.g. RuntimeError without tkinter; the tests that need the module
+        # report the failure themselves
+        pass
 
-@pytest.fixture
-def temp_dir():
-    """Create a temporary directory for tests."""
-    temp_dir = tempfile.mkdtemp()
-    yield temp_dir
-    shutil.rmtree(temp_dir)
-
-# Fixture for sample media files
-@pytest.fixture
-def sample_audio_file(temp_dir):
+# Fixture for sample media files; generated once per session, treat as read-only
+@pytest.fixture(scope="session")
+def sample_audio_file(tmp_path_factory):
     """Create a sample audio file for tests."""
     import wave
-    import struct
+    import numpy as np
     
     # Create a simple WAV file with a sine wave
     sample_rate = 44100
     duration = 1  # 1 second
     frequency = 440  # A4 note
     
-    samples = []
-    for i in range(int(sample_rate * duration)):
-        sample = 32767 * 0.5 * math.sin(2 * math.pi * frequency * i / sample_rate)
-        samples.append(struct.pack('<h', int(sample)))
+    # 16-bit samples at half scale, truncated towards zero
+    t = np.arange(int(sample_rate * duration)) / sample_rate
+    data = (32767 * 0.5 * np.sin(2 * np.pi * frequency * t)).astype('<i2').tobytes()
     
-    filename = Path(temp_dir) / "sample.wav"
+    filename = tmp_path_factory.mktemp("audio") / "sample.wav"
     with wave.open(str(filename), 'w') as wav_file:
         wav_file.setnchannels(1)  # Mono
         wav_file.setsampwidth(2)   # 16-bit
         wav_file.setframerate(sample_rate)
-        wav_file.writeframes(b''.join(samples))
+        wav_file.writeframes(data)
     
     return filename
-
-# Import math for the sample file fixture
-import math
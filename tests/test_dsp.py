@@ -0,0 +1,232 @@
+"""
+DSP tests for Unified Media Converter (FIR design and convolution)
+"""
+
+import io
+import struct
+import wave
+
+import numpy as np
+import pytest
+
+# the DSP code lives in the GUI module, which needs tkinter at import time
+pytest.importorskip("tkinter")
+
+import unified_media_converter as umc  # noqa: E402
+from unified_media_converter import (  # noqa: E402
+    Band,
+    BandArray,
+    band_coeffs,
+    cached_linear_phase_fir,
+    compute_per_band_responses,
+    compute_total_response,
+    design_linear_phase_fir,
+    equal_power_fades,
+    highpass_response,
+    lowpass_response,
+    map_wav_pcm,
+    ola_convolve_blocks,
+    peaking_eq_response,
+    read_pcm_blocks,
+    read_wav_layout,
+    wav_header,
+    WavWriter,
+)
+
+
+def _read_wav(path):
+    with wave.open(str(path), 'rb') as wf:
+        nch = wf.getnchannels()
+        data = np.frombuffer(wf.readframes(wf.getnframes()), dtype=np.int16)
+    return data.reshape(-1, nch)
+
+
+def _write_wav(path, data, sample_rate=44100):
+    with wave.open(str(path), 'wb') as wf:
+        wf.setnchannels(data.shape[1])
+        wf.setsampwidth(2)
+        wf.setframerate(sample_rate)
+        wf.writeframes(data.astype(np.int16).tobytes())
+
+
+@pytest.fixture
+def scipy_available(monkeypatch):
+    """Setter for SCIPY_AVAILABLE that also drops the cached FFT backend."""
+    def set_available(value):
+        monkeypatch.setattr(umc, "SCIPY_AVAILABLE", value)
+        umc._fft_backend.cache_clear()
+
+    yield set_available
+    # let the next test resolve the backend from the restored flag
+    umc._fft_backend.cache_clear()
+
+
+@pytest.mark.parametrize("use_numba", [True, False])
+def test_total_response_is_product_of_band_responses(monkeypatch, use_numba):
+    """The vectorized (or JIT) response equals the product of the per-band biquads."""
+    monkeypatch.setattr(umc, "NUMBA_AVAILABLE", umc.NUMBA_AVAILABLE and use_numba)
+    fs = 44100.0
+    freqs = np.linspace(0, fs / 2, 513)
+    bands = [
+        Band(type='parametric', f=1000.0, g=6.0, width=2.0),
+        Band(type='parametric', f=300.0, g=-4.0, width_type='oct', width=1.5, invert=True),
+        Band(type='lowpass', f=8000.0),
+        Band(type='highpass', f=40.0),
+    ]
+    expected = (
+        peaking_eq_response(bands[0], freqs, fs)
+        * peaking_eq_response(bands[1], freqs, fs)
+        * lowpass_response(8000.0, freqs, fs)
+        * highpass_response(40.0, freqs, fs)
+    )
+    np.testing.assert_allclose(compute_total_response(bands, freqs, fs), expected, rtol=1e-9, atol=1e-12)
+    np.testing.assert_array_equal(compute_total_response([], freqs, fs), np.ones_like(freqs))
+
+    per_band = compute_per_band_responses(bands, freqs, fs)
+    assert per_band.shape == (len(bands), len(freqs))
+    np.testing.assert_allclose(per_band[2], lowpass_response(8000.0, freqs, fs), rtol=1e-9, atol=1e-12)
+    np.testing.assert_allclose(np.prod(per_band, axis=0), expected, rtol=1e-9, atol=1e-12)
+
+
+def test_band_array_coeffs_match_scalar_design():
+    """The structure-of-arrays coefficients equal the per-band formulas."""
+    bands = [
+        Band(type='parametric', f=30000.0, g=9.0, width=0.3),
+        Band(type='parametric', f=440.0, g=-6.0, width_type='oct', width=0.5, invert=True),
+        Band(type='lowpass', f=5000.0, invert=True),
+        Band(type='highpass', f=100.0),
+        Band(type='notch', f=100.0),
+    ]
+    expected = np.array([band_coeffs(b, 48000.0) for b in bands])
+    np.testing.assert_allclose(BandArray.from_bands(bands).coeffs(48000.0), expected, rtol=1e-12, atol=1e-14)
+
+
+def test_cached_fir_matches_design_and_is_shared():
+    """Identical band settings reuse one read-only FIR."""
+    bands = [Band(type='parametric', f=2000.0, g=-3.0), Band(type='highpass', f=60.0)]
+    fir = cached_linear_phase_fir(bands, 48000, 512)
+    np.testing.assert_array_equal(fir, design_linear_phase_fir(bands, 48000, 512))
+    assert fir.dtype == np.float64
+    assert cached_linear_phase_fir([b.copy() for b in bands], 48000, 512) is fir
+    assert not fir.flags.writeable
+    assert cached_linear_phase_fir(bands, 44100, 512) is not fir
+
+
+def test_equal_power_fades_keep_constant_power():
+    """The cached crossfade gains run 1 -> 0 / 0 -> 1 with a^2 + b^2 == 1."""
+    fade_out, fade_in = equal_power_fades(1000)
+    assert fade_out.shape == fade_in.shape == (1000, 1)
+    np.testing.assert_allclose(fade_out[[0, -1], 0], [1.0, 0.0], atol=1e-6)
+    np.testing.assert_allclose(fade_in[[0, -1], 0], [0.0, 1.0], atol=1e-6)
+    np.testing.assert_allclose(fade_out ** 2 + fade_in ** 2, 1.0, rtol=1e-5)
+    assert equal_power_fades(1000)[0] is fade_out
+    assert not fade_out.flags.writeable
+
+
+def _direct_convolution(data, fir):
+    out = np.stack([np.convolve(data[:, ch].astype(np.float64), fir) for ch in range(data.shape[1])], axis=1)
+    return np.clip(out, -32767, 32767).astype(np.int16).astype(np.int32)
+
+
+def _ola_convolution(data, fir, block_size):
+    blocks = (data[i:i + block_size] for i in range(0, len(data), block_size))
+    # the yielded blocks are scratch, so each is converted before the next
+    out = [np.clip(y, -32767, 32767).astype(np.int16) for y in ola_convolve_blocks(blocks, fir, data.shape[1], block_size)]
+    return np.concatenate(out).astype(np.int32)
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize("use_scipy", [True, False])
+def test_overlap_add_matches_direct_convolution(sample_audio_file, scipy_available, use_scipy):
+    """Block-wise overlap-add (with either FFT backend) equals a direct full convolution."""
+    scipy_available(umc.SCIPY_AVAILABLE and use_scipy)
+    fir = design_linear_phase_fir([Band(type='parametric', f=1000.0, g=6.0)], 44100, 256)
+    data = _read_wav(sample_audio_file)
+    result = _ola_convolution(data, fir, 4096)
+    expected = _direct_convolution(data, fir)
+    assert result.shape == expected.shape
+    assert np.max(np.abs(result - expected)) <= 1
+
+
+def test_overlap_add_stereo_channels_are_independent(scipy_available):
+    """Each channel is convolved on its own."""
+    scipy_available(False)
+    rng = np.random.default_rng(0)
+    data = rng.integers(-8000, 8000, size=(10000, 2)).astype(np.int16)
+    data[:, 1] = 0
+    fir = design_linear_phase_fir([Band(type='lowpass', f=4000.0)], 44100, 128)
+    result = _ola_convolution(data, fir, 3000)
+
+    expected = _direct_convolution(data, fir)
+    assert np.max(np.abs(result - expected)) <= 1
+    assert not result[:, 1].any()
+
+
+def test_partitioned_convolution_for_long_fir(scipy_available):
+    """FIRs longer than the block size take the partitioned path."""
+    scipy_available(False)
+    rng = np.random.default_rng(2)
+    data = rng.integers(-8000, 8000, size=(5000, 2)).astype(np.int16)
+    fir = design_linear_phase_fir([Band(type='parametric', f=120.0, g=6.0, width=4.0)], 44100, 1000)
+    result = _ola_convolution(data, fir, 256)
+
+    expected = _direct_convolution(data, fir)
+    assert result.shape == expected.shape
+    assert np.max(np.abs(result - expected)) <= 1
+
+
+def test_map_wav_pcm_skips_extra_riff_chunks(tmp_path):
+    """A LIST chunk ahead of the PCM data (as ffmpeg writes) is skipped."""
+    data = (np.arange(-3000, 3000, dtype=np.int16) * 5).reshape(-1, 2)
+    body = data.tobytes()
+    info = b"INFOISFT" + struct.pack("<I", 6) + b"umc\x00\x00\x00"
+    header = wav_header(2, 22050, len(body))
+    in_path = tmp_path / "list.wav"
+    with open(in_path, "wb") as f:
+        f.write(header[:36])
+        f.write(b"LIST" + struct.pack("<I", len(info)) + info)
+        f.write(header[36:])
+        f.write(body)
+    assert read_wav_layout(str(in_path)) == (2, 22050, 2, 36 + 8 + len(info) + 8, len(body))
+
+    pcm, sr = map_wav_pcm(str(in_path))
+    assert sr == 22050
+    np.testing.assert_array_equal(pcm, data)
+    del pcm
+
+
+def test_map_wav_pcm_handles_empty_and_stereo_files(tmp_path):
+    """PCM is mapped frame by frame; a file without samples gives an empty array."""
+    data = np.arange(-1000, 1000, dtype=np.int16).reshape(-1, 2)
+    path = tmp_path / "mapped.wav"
+    _write_wav(path, data, sample_rate=32000)
+    pcm, sr = map_wav_pcm(str(path))
+    assert sr == 32000
+    np.testing.assert_array_equal(pcm, data)
+    del pcm
+
+    empty = tmp_path / "empty.wav"
+    _write_wav(empty, np.zeros((0, 2), dtype=np.int16))
+    pcm, _ = map_wav_pcm(str(empty))
+    assert pcm.shape == (0, 2)
+
+
+def test_read_pcm_blocks_reassembles_stream():
+    """Raw PCM from a pipe-like stream comes back as full blocks plus a remainder."""
+    data = np.arange(-5000, 5000, dtype=np.int16).reshape(-1, 2)
+    blocks = [b.copy() for b in read_pcm_blocks(io.BytesIO(data.tobytes()), 2, 1024)]
+    assert [len(b) for b in blocks] == [1024, 1024, 1024, 1024, 904]
+    np.testing.assert_array_equal(np.concatenate(blocks), data)
+
+
+def test_wav_writer_patches_sizes_on_close(tmp_path):
+    """Streamed PCM gets a valid header even when far less than expected was written."""
+    data = np.arange(-2000, 2000, dtype=np.int16).reshape(-1, 2)
+    path = tmp_path / "stream.wav"
+    with WavWriter(str(path), 2, 48000, expected_frames=100000) as writer:
+        writer.write(data[:500].tobytes())
+        writer.write(data[500:].tobytes())
+    assert path.stat().st_size == 44 + data.nbytes
+    with wave.open(str(path), 'rb') as wf:
+        assert (wf.getnchannels(), wf.getframerate(), wf.getnframes()) == (2, 48000, len(data))
+    np.testing.assert_array_equal(_read_wav(path), data)